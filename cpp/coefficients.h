@@ -85,6 +85,30 @@ std::pair<std::vector<PetscScalar>, int> pack_gradient_quadrature(
     const int q_degree, std::span<const std::int32_t> active_entities,
     dolfinx::fem::IntegralType integral);
 
+/// @brief Pack a coefficient and its gradient at quadrature points.
+///
+/// Fused version of pack_coefficient_quadrature and
+/// pack_gradient_quadrature: the basis functions are tabulated once and the
+/// entities are traversed once, with the values and gradients for the jth
+/// entry in active_entities packed into adjacent column ranges of the same
+/// row, c[j*cstride:(j+1)*cstride] with
+/// cstride=(num_quadrature_points)*block_size*value_size*(1+gdim). The
+/// first (num_quadrature_points)*block_size*value_size entries of a row
+/// hold the values (ordered as in pack_coefficient_quadrature), the
+/// remaining entries hold the gradients (ordered as in
+/// pack_gradient_quadrature).
+///
+/// @param[in] coeff The coefficient to pack
+/// @param[in] q_degree The quadrature degree
+/// @param[in] active_entities List of active entities.
+/// @param[in] integral The integral type (cells or exterior facet)
+/// @returns c The packed coefficients and the number of coeffs per entity
+std::pair<std::vector<PetscScalar>, int>
+pack_coefficient_and_gradient_quadrature(
+    std::shared_ptr<const dolfinx::fem::Function<PetscScalar>> coeff,
+    const int q_degree, std::span<const std::int32_t> active_entities,
+    dolfinx::fem::IntegralType integral);
+
 /// Prepare circumradii of triangle/tetrahedron for assembly with custom
 /// kernels by packing them as an array, where the ith entry of the output
 /// corresponds to the circumradius of the ith cell facet pair.
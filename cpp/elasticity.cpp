@@ -141,8 +141,8 @@ void dolfinx_contact::compute_sigma_n_opp(mdspan4_t sig_n_opp,
 std::vector<double> dolfinx_contact::compute_contact_forces(
     std::span<const double> grad_u, std::span<const double> n_x,
    const std::size_t num_q_points,
-    std::size_t num_facets, const std::size_t gdim, const double mu,
-    const double lmbda)
+    std::size_t num_facets, const std::size_t gdim,
+    std::span<const double> mu, std::span<const double> lmbda)
 {
   std::vector<double> sig_n_u(gdim);
   
@@ -157,7 +157,7 @@ std::vector<double> dolfinx_contact::compute_contact_forces(
       dolfinx_contact::compute_sigma_n_u(
           sig_n_u,
           grad_u.subspan(f_offset * gdim + q * gdim * gdim, gdim * gdim),
-          n_x.subspan(f_offset + q * gdim, gdim), mu, lmbda);
+          n_x.subspan(f_offset + q * gdim, gdim), mu[f], lmbda[f]);
 
       for (std::size_t j = 0; j < gdim; ++j)
       {
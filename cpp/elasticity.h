@@ -86,12 +86,12 @@ void compute_sigma_n_opp(mdspan4_t sig_n_opp, std::span<const double> grad_v,
 /// @param[in] num_q_points The number of quadrature points
 /// @param[in] num_facets   The number of facets
 /// @param[in] gdim         The geometrical dimension of the mesh
-/// @param[in] mu           The first Lame parameter
-/// @param[in] lmbda        The second Lame parameter
+/// @param[in] mu           The first Lame parameter for each facet
+/// @param[in] lmbda        The second Lame parameter for each facet
 /// @return vector containing surface pressure values for each quadrature point on each facet
 std::vector<double>compute_contact_forces(
     std::span<const double> grad_u, std::span<const double> n_x, const std::size_t num_q_points,
-    std::size_t num_facets, const std::size_t gdim, const double mu,
-    const double lmbda);
+    std::size_t num_facets, const std::size_t gdim,
+    std::span<const double> mu, std::span<const double> lmbda);
 
 } // namespace dolfinx_contact
\ No newline at end of file
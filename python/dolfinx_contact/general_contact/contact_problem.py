@@ -84,17 +84,20 @@ class ContactProblem(dolfinx_contact.cpp.Contact):
         ndofs_cell = len(du.function_space.dofmap.cell_dofs(0))
         gdim = du.function_space.mesh.geometry.dim
 
+        # Bind the packers once; this method runs every Newton iteration
+        pack_coefficient = dolfinx_contact.cpp.pack_coefficient_quadrature
+        pack_gradient = dolfinx_contact.cpp.pack_gradient_quadrature
         with common.Timer("~~Contact: Pack u"):
             for i in range(self._num_pairs):
                 offset0 = 4 + self._num_q_points[i] * gdim * (2 + ndofs_cell * max_links)
                 offset1 = offset0 + self._num_q_points[i] * gdim
                 # Pack du on integration surface
-                self.coeffs[i][:, offset0:offset1] = dolfinx_contact.cpp.pack_coefficient_quadrature(
+                self.coeffs[i][:, offset0:offset1] = pack_coefficient(
                     du._cpp_object, self.q_deg, self.entities[i])[:, :]
                 offset0 = offset1
                 offset1 = offset0 + self._num_q_points[i] * gdim * gdim
                 # Pack grad(u + du) on integration surface
-                self.coeffs[i][:, offset0:offset1] = dolfinx_contact.cpp.pack_gradient_quadrature(
+                self.coeffs[i][:, offset0:offset1] = pack_gradient(
                     du._cpp_object, self.q_deg, self.entities[i])[:, :] + self._grad_u[i][:, :]
                 offset0 = offset1
                 offset1 = offset0 + self._num_q_points[i] * gdim
@@ -317,7 +320,13 @@ class ContactProblem(dolfinx_contact.cpp.Contact):
         for the current contact detection
         Args: j_form - The jacobian form
         """
-        return super().create_matrix(j_form._cpp_object)
+        a_mat = super().create_matrix(j_form._cpp_object)
+        # The sparsity pattern is fixed for a given contact detection: keep
+        # it when rows are zeroed between Newton iterations and error out if
+        # an assembly tries to introduce a nonzero outside the pattern
+        a_mat.setOption(PETSc.Mat.Option.KEEP_NONZERO_PATTERN, True)
+        a_mat.setOption(PETSc.Mat.Option.NEW_NONZERO_ALLOCATION_ERR, True)
+        return a_mat
 
     def assemble_vector(self, b: PETSc.Vec,  # type: ignore
                         function_space: fem.FunctionSpaceBase) -> None:
@@ -13,7 +13,8 @@ from .contact_meshes import (create_box_mesh_2D,
                              create_2d_rectangle_split,
                              create_halfsphere_box_mesh,
                              create_quarter_disks_mesh,
-                             sliding_wedges)
+                             sliding_wedges,
+                             generate_meshes)
 from .onesided_meshes import create_disk_mesh, create_sphere_mesh
 from .split_box import (create_split_box_2D, create_split_box_3D, create_unsplit_box_2d, create_unsplit_box_3d,
                         vertical_line, horizontal_sine)
@@ -40,4 +41,5 @@ __all__ = ["create_christmas_tree_mesh",
            "create_2d_rectangle_split",
            "create_halfsphere_box_mesh",
            "create_quarter_disks_mesh",
-           "sliding_wedges"]
+           "sliding_wedges",
+           "generate_meshes"]
@@ -2,6 +2,9 @@
 #
 # SPDX-License-Identifier:    MIT
 
+import math
+import os
+
 import gmsh
 import numpy as np
 from dolfinx.io import gmshio, XDMFFile
@@ -10,202 +13,314 @@ from mpi4py import MPI
 __all__ = ["create_circle_plane_mesh", "create_circle_circle_mesh", "create_box_mesh_2D",
            "create_box_mesh_3D", "create_sphere_plane_mesh", "create_sphere_sphere_mesh",
            "create_cylinder_cylinder_mesh", "create_2d_rectangle_split", "create_quarter_disks_mesh",
-           "sliding_wedges"]
+           "sliding_wedges", "generate_meshes", "shutdown"]
+
+
+def _initialize_gmsh(num_threads=None, verbose=False):
+    """Initialize gmsh if needed and clear any model state left over from a
+    previous mesh generation.
+
+    The gmsh kernel is kept alive between calls so repeated mesh
+    generation does not pay the initialize/finalize cycle; call
+    :func:`shutdown` to finalize it.
+    """
+    if not gmsh.isInitialized():
+        gmsh.initialize()
+    gmsh.clear()
+    # Use all available cores for the threaded meshing algorithms
+    gmsh.option.setNumber("General.NumThreads", num_threads or os.cpu_count() or 1)
+    # Info-level terminal output serializes CAD construction behind stdout
+    # flushes; keep gmsh quiet unless explicitly asked for
+    gmsh.option.setNumber("General.Terminal", 1 if verbose else 0)
+    gmsh.option.setNumber("General.Verbosity", 5 if verbose else 1)
+    # Restore the default 3D algorithm; the simplex generators opt into HXT
+    gmsh.option.setNumber("Mesh.Algorithm3D", 1)
+    # Write binary MSH 4.1 without parametric coordinates; ASCII output is
+    # several times larger and slower to write and read back
+    gmsh.option.setNumber("Mesh.Binary", 1)
+    gmsh.option.setNumber("Mesh.MshFileVersion", 4.1)
+    gmsh.option.setNumber("Mesh.SaveParametric", 0)
+
+
+def shutdown():
+    """Finalize the gmsh kernel kept alive by the mesh generators."""
+    if gmsh.isInitialized():
+        gmsh.finalize()
+
+
+def generate_meshes(specs, comm=MPI.COMM_WORLD):
+    """Generate several meshes, distributed round-robin over the ranks of comm.
+
+    Parameters
+    ==========
+    specs
+        List of (function, kwargs) tuples, where function is one of the mesh
+        generators in this module
+    comm
+        MPI communicator to distribute the work over
+
+    Each generator is invoked with ``comm=MPI.COMM_SELF`` so that it runs
+    locally on its assigned rank without collective behaviour; a single
+    barrier synchronizes all ranks at the end.
+    """
+    for i, (func, kwargs) in enumerate(specs):
+        if i % comm.size == comm.rank:
+            func(comm=MPI.COMM_SELF, **kwargs)
+    comm.Barrier()
+
+
+def _tag_boundary(bndry, group_per_entity: bool = True):
+    """Add physical groups for the (dim, tag) entities returned by getBoundary.
+
+    Binds the gmsh function once to avoid re-resolving the attribute chain
+    for every boundary entity. By default one group is created per entity,
+    which is what the hard-coded tag numbering in the demos relies on; with
+    ``group_per_entity=False`` the entities are grouped by dimension in a
+    vectorized NumPy pass and a single group is created per dimension.
+    """
+    add_group = gmsh.model.addPhysicalGroup
+    if group_per_entity:
+        for dim, tag in bndry:
+            add_group(dim, [tag])
+    else:
+        arr = np.asarray(bndry, dtype=np.int32)
+        for dim in np.unique(arr[:, 0]):
+            add_group(int(dim), arr[arr[:, 0] == dim, 1].tolist())
+
+
+def _add_rectangle(x: float, y: float, width: float, height: float) -> int:
+    """Build an axis-aligned rectangle surface from four corner points.
+
+    Points and lines are created counter-clockwise from the lower left
+    corner, with the closing edge first, so that the boundary entities
+    keep the ordering that downstream hard-coded physical tags rely on.
+    ``occ.addRectangle`` is avoided on purpose: it orders the edges
+    differently and would silently retag the boundaries.
+    """
+    occ = gmsh.model.occ
+    # The OCC kernel has no batch point/line creation, so the coordinates
+    # and connectivity are prepared as arrays and dispatched with a bound
+    # method, one FFI call per entity
+    corners = np.array([[x, y], [x + width, y], [x + width, y + height], [x, y + height]],
+                       dtype=np.float64)
+    add_point = occ.addPoint
+    ps = np.array([add_point(cx, cy, 0) for cx, cy in corners], dtype=np.int32)
+    add_line = occ.addLine
+    lines = [add_line(p0, p1) for p0, p1 in np.stack([np.roll(ps, 1), ps], axis=1)]
+    curve = occ.addCurveLoop(lines)
+    return occ.addPlaneSurface([curve])
+
+
+def _configure_quads(quads: bool, algorithm: int = 8, subdivide: bool = True):
+    """Set (or reset) the recombination options controlling quad/hex meshing.
+
+    The gmsh session is kept alive between mesh generations, so the
+    options are always written explicitly: passing ``quads=False``
+    restores the defaults instead of leaking a previous model's
+    recombination settings into the next one.
+    """
+    gmsh.option.setNumber("Mesh.RecombinationAlgorithm", algorithm if quads else 1)
+    gmsh.option.setNumber("Mesh.RecombineAll", 2 if quads else 0)
+    gmsh.option.setNumber("Mesh.SubdivisionAlgorithm", 1 if quads and subdivide else 0)
+
+
+def _set_point_refinement_field(x0: float, y0: float, lc_min: float, lc_max: float,
+                                dist_min: float, dist_max: float):
+    """Set a background field refining the mesh towards the point (x0, y0, 0).
+
+    Equivalent to a Distance + Threshold field pair, but evaluates the
+    closed-form distance through a MathEval expression, skipping the
+    nearest-node search the Distance field performs for every background
+    mesh query.
+    """
+    field = gmsh.model.mesh.field
+    tag = field.add("MathEval")
+    dist = f"sqrt((x - ({x0}))^2 + (y - ({y0}))^2)"
+    ramp = f"max({dist} - ({dist_min}), 0) / ({dist_max - dist_min})"
+    field.setString(tag, "F", f"min({lc_max}, {lc_min} + ({lc_max - lc_min}) * {ramp})")
+    field.setAsBackgroundMesh(tag)
 
 
 def create_circle_plane_mesh(filename: str, quads: bool = False, res=0.1, order: int = 1,
-                             r: float = 0.25, height: float = 0.25, length: float = 1.0, gap: float = 0.01):
+                             r: float = 0.25, height: float = 0.25, length: float = 1.0, gap: float = 0.01,
+                             comm=MPI.COMM_WORLD, num_threads=None, verbose=False):
     """
     Create a circular mesh, with center at (0.0,0.0,0) with radius r
     and a box [-length/2, length/2]x[-height-gap-r,-gap-r]
     """
     center = [0, 0, 0]
-    gmsh.initialize()
-    if MPI.COMM_WORLD.rank == 0:
+    _initialize_gmsh(num_threads, verbose)
+    if comm.rank == 0:
+        occ = gmsh.model.occ
+        add_point = occ.addPoint
+        add_arc = occ.addCircleArc
+        add_curve_loop = occ.addCurveLoop
+        add_surface = occ.addPlaneSurface
         # Create circular mesh (divided into 4 segments)
-        c = gmsh.model.occ.addPoint(center[0], center[1], center[2])
-        contact_pt = gmsh.model.occ.addPoint(center[0], center[1] - r, center[2])
-        left = gmsh.model.occ.addPoint(-r, 0, 0)
-        right = gmsh.model.occ.addPoint(r, 0, 0)
-        angle = np.pi / 3
-        top_left = gmsh.model.occ.addPoint(-r * np.cos(angle), r * np.sin(angle), 0)
-        top_right = gmsh.model.occ.addPoint(r * np.cos(angle), r * np.sin(angle), 0)
-
-        arcs = [gmsh.model.occ.addCircleArc(
-            left, c, top_left), gmsh.model.occ.addCircleArc(
-            top_left, c, top_right), gmsh.model.occ.addCircleArc(
-            top_right, c, right), gmsh.model.occ.addCircleArc(
+        c = add_point(center[0], center[1], center[2])
+        left = add_point(-r, 0, 0)
+        right = add_point(r, 0, 0)
+        angle = math.pi / 3
+        ca = math.cos(angle)
+        sa = math.sin(angle)
+        top_left = add_point(-r * ca, r * sa, 0)
+        top_right = add_point(r * ca, r * sa, 0)
+
+        arcs = [add_arc(
+            left, c, top_left), add_arc(
+            top_left, c, top_right), add_arc(
+            top_right, c, right), add_arc(
             right, c, left)]
-        curve = gmsh.model.occ.addCurveLoop(arcs)
-        gmsh.model.occ.synchronize()
-
-        surface = gmsh.model.occ.addPlaneSurface([curve])
+        curve = add_curve_loop(arcs)
+        surface = add_surface([curve])
         # Create box
-        p0 = gmsh.model.occ.addPoint(-length / 2, -height - r - gap, 0)
-        p1 = gmsh.model.occ.addPoint(length / 2, -height - r - gap, 0)
-        p2 = gmsh.model.occ.addPoint(length / 2, -r - gap, 0)
-        p3 = gmsh.model.occ.addPoint(-length / 2, -r - gap, 0)
-        ps = [p0, p1, p2, p3]
-        lines = [gmsh.model.occ.addLine(ps[i - 1], ps[i]) for i in range(len(ps))]
-        curve2 = gmsh.model.occ.addCurveLoop(lines)
-        surface2 = gmsh.model.occ.addPlaneSurface([curve2])
+        surface2 = _add_rectangle(-length / 2, -height - r - gap, length, height)
 
         # Synchronize and create physical tags
-        gmsh.model.occ.synchronize()
+        occ.synchronize()
         gmsh.model.addPhysicalGroup(2, [surface], tag=1)
 
         gmsh.model.addPhysicalGroup(2, [surface2], tag=2)
         bndry2 = gmsh.model.getBoundary([(2, surface2)], oriented=False)
-        [gmsh.model.addPhysicalGroup(b[0], [b[1]]) for b in bndry2]
+        _tag_boundary(bndry2)
         [gmsh.model.addPhysicalGroup(1, [arc]) for arc in arcs]
 
-        gmsh.model.mesh.field.add("Distance", 1)
-        gmsh.model.mesh.field.setNumbers(1, "NodesList", [contact_pt])
-        gmsh.model.mesh.field.add("Threshold", 2)
-        gmsh.model.mesh.field.setNumber(2, "IField", 1)
-        gmsh.model.mesh.field.setNumber(2, "LcMin", 0.5 * res)
-        gmsh.model.mesh.field.setNumber(2, "LcMax", 2 * res)
-        gmsh.model.mesh.field.setNumber(2, "DistMin", r / 2)
-        gmsh.model.mesh.field.setNumber(2, "DistMax", r)
-        if quads:
-            gmsh.option.setNumber("Mesh.RecombinationAlgorithm", 8)
-            gmsh.option.setNumber("Mesh.RecombineAll", 2)
-            gmsh.option.setNumber("Mesh.SubdivisionAlgorithm", 1)
-        gmsh.model.mesh.field.setAsBackgroundMesh(2)
+        # Refine towards the contact point at the bottom of the disk
+        _set_point_refinement_field(center[0], center[1] - r, 0.5 * res, 2 * res, r / 2, r)
+        _configure_quads(quads)
 
         gmsh.model.mesh.generate(2)
         gmsh.model.mesh.setOrder(order)
 
         # gmsh.option.setNumber("Mesh.SaveAll", 1)
         gmsh.write(filename)
-    MPI.COMM_WORLD.Barrier()
-    gmsh.finalize()
+    comm.Barrier()
+    gmsh.clear()
 
 
 def create_halfdisk_plane_mesh(filename: str, res=0.1, order: int = 1, quads=False,
-                               r=0.25, height=0.25, length=1.0, gap=0.01):
+                               r=0.25, height=0.25, length=1.0, gap=0.01, comm=MPI.COMM_WORLD,
+                               num_threads=None, verbose=False):
     """
     Create a halfdisk, with center at (0.0,0.0,0), radius r and  y<=0.0
     and a box [-length/2, length/2]x[-height-gap-r,-gap-r]
     """
     center = [0, 0, 0]
-    gmsh.initialize()
-    if MPI.COMM_WORLD.rank == 0:
+    _initialize_gmsh(num_threads, verbose)
+    if comm.rank == 0:
+        occ = gmsh.model.occ
+        add_point = occ.addPoint
+        add_line = occ.addLine
+        add_arc = occ.addCircleArc
+        add_curve_loop = occ.addCurveLoop
+        add_surface = occ.addPlaneSurface
         # Create circular mesh (divided into 4 segments)
-        c = gmsh.model.occ.addPoint(center[0], center[1], center[2])
-        pt_refine = gmsh.model.occ.addPoint(0.0, -r, 0.0)
-        left = gmsh.model.occ.addPoint(-r, 0, 0)
-        right = gmsh.model.occ.addPoint(r, 0, 0)
-        arc = gmsh.model.occ.addCircleArc(right, c, left)
-        line = gmsh.model.occ.addLine(left, right)
-
-        curve = gmsh.model.occ.addCurveLoop([arc, line])
-        gmsh.model.occ.synchronize()
-        surface = gmsh.model.occ.addPlaneSurface([curve])
-        # Create boxpy
-        p0 = gmsh.model.occ.addPoint(-length / 2, -r - height - gap, 0)
-        p1 = gmsh.model.occ.addPoint(length / 2, -r - height - gap, 0)
-        p2 = gmsh.model.occ.addPoint(length / 2, -r - gap, 0)
-        p3 = gmsh.model.occ.addPoint(-length / 2, -r - gap, 0)
-        ps = [p0, p1, p2, p3]
-        lines = [gmsh.model.occ.addLine(ps[i - 1], ps[i]) for i in range(len(ps))]
-        curve2 = gmsh.model.occ.addCurveLoop(lines)
-        surface2 = gmsh.model.occ.addPlaneSurface([curve2])
+        c = add_point(center[0], center[1], center[2])
+        left = add_point(-r, 0, 0)
+        right = add_point(r, 0, 0)
+        arc = add_arc(right, c, left)
+        line = add_line(left, right)
+
+        curve = add_curve_loop([arc, line])
+        surface = add_surface([curve])
+        # Create box
+        surface2 = _add_rectangle(-length / 2, -r - height - gap, length, height)
 
         # Synchronize and create physical tags
-        gmsh.model.occ.synchronize()
+        occ.synchronize()
         gmsh.model.addPhysicalGroup(2, [surface], tag=1)
 
         gmsh.model.addPhysicalGroup(2, [surface2], tag=2)
         bndry2 = gmsh.model.getBoundary([(2, surface2)], oriented=False)
-        [gmsh.model.addPhysicalGroup(b[0], [b[1]]) for b in bndry2]
+        _tag_boundary(bndry2)
         gmsh.model.addPhysicalGroup(1, [arc])
         gmsh.model.addPhysicalGroup(1, [line])
 
-        gmsh.model.mesh.field.add("Distance", 1)
-        gmsh.model.mesh.field.setNumbers(1, "NodesList", [pt_refine])
-
-        gmsh.model.mesh.field.add("Threshold", 2)
-        gmsh.model.mesh.field.setNumber(2, "IField", 1)
-        gmsh.model.mesh.field.setNumber(2, "LcMin", 0.5 * res)
-        gmsh.model.mesh.field.setNumber(2, "LcMax", 2 * res)
-        gmsh.model.mesh.field.setNumber(2, "DistMin", r / 2)
-        gmsh.model.mesh.field.setNumber(2, "DistMax", r)
-        gmsh.model.mesh.field.setAsBackgroundMesh(2)
-        if quads:
-            gmsh.option.setNumber("Mesh.RecombinationAlgorithm", 8)
-            gmsh.option.setNumber("Mesh.RecombineAll", 2)
-            gmsh.option.setNumber("Mesh.SubdivisionAlgorithm", 1)
+        # Refine towards the contact point at the bottom of the halfdisk
+        _set_point_refinement_field(0.0, -r, 0.5 * res, 2 * res, r / 2, r)
+        _configure_quads(quads)
 
         gmsh.model.mesh.generate(2)
         gmsh.model.mesh.setOrder(order)
 
         # gmsh.option.setNumber("Mesh.SaveAll", 1)
         gmsh.write(filename)
-    MPI.COMM_WORLD.Barrier()
-    gmsh.finalize()
+    comm.Barrier()
+    gmsh.clear()
 
 
-def create_quarter_disks_mesh(filename: str, res=0.1, order: int = 1, quads=False, r=0.25, gap=0.01):
+def create_quarter_disks_mesh(filename: str, res=0.1, order: int = 1, quads=False, r=0.25, gap=0.01,
+                              comm=MPI.COMM_WORLD, num_threads=None, verbose=False):
     """
     Create a quarter disk, with center at (0.0,0.0,0), radius r and  y<=0.0, x>=0
     and a a second quarter disk with center (0.0, -2r - gap, 0.0), radius r and y>= -3r-gap, x>=0
     """
     center = [0, 0, 0]
-    gmsh.initialize()
-    if MPI.COMM_WORLD.rank == 0:
+    _initialize_gmsh(num_threads, verbose)
+    if comm.rank == 0:
+        occ = gmsh.model.occ
+        add_point = occ.addPoint
+        add_line = occ.addLine
+        add_arc = occ.addCircleArc
+        add_curve_loop = occ.addCurveLoop
+        add_surface = occ.addPlaneSurface
         # Create first quarter disk
-        c = gmsh.model.occ.addPoint(center[0], center[1], center[2])
-        bottom1 = gmsh.model.occ.addPoint(0.0, -r, 0.0)
-        top_right = gmsh.model.occ.addPoint(r, 0, 0)
-        top_left = gmsh.model.occ.addPoint(-r, 0, 0)
-        angle = np.pi / 6
-        right1 = gmsh.model.occ.addPoint(r * np.sin(angle), -r * np.cos(angle), 0)
-        left1 = gmsh.model.occ.addPoint(-r * np.sin(angle), -r * np.cos(angle), 0)
+        c = add_point(center[0], center[1], center[2])
+        bottom1 = add_point(0.0, -r, 0.0)
+        top_right = add_point(r, 0, 0)
+        top_left = add_point(-r, 0, 0)
+        angle = math.pi / 6
+        sa = math.sin(angle)
+        ca = math.cos(angle)
+        right1 = add_point(r * sa, -r * ca, 0)
+        left1 = add_point(-r * sa, -r * ca, 0)
         arcs1 = []
-        arcs1.append(gmsh.model.occ.addCircleArc(top_left, c, left1))
-        arcs1.append(gmsh.model.occ.addCircleArc(left1, c, bottom1))
-        arcs1.append(gmsh.model.occ.addCircleArc(bottom1, c, right1))
-        arcs1.append(gmsh.model.occ.addCircleArc(right1, c, top_right))
-        line1 = gmsh.model.occ.addLine(top_right, c)
-        line2 = gmsh.model.occ.addLine(c, bottom1)
-        line3 = gmsh.model.occ.addLine(top_left, c)
-        curve = gmsh.model.occ.addCurveLoop([arcs1[2], arcs1[3], line1, line2])
-        curve2 = gmsh.model.occ.addCurveLoop([-line2, -line3, arcs1[0], arcs1[1]])
-        gmsh.model.occ.synchronize()
-        surface = gmsh.model.occ.addPlaneSurface([curve])
-        surface2 = gmsh.model.occ.addPlaneSurface([curve2])
-
-        # Create second quarter disk
-        c2 = gmsh.model.occ.addPoint(center[0], center[1] - 2 * r - gap, center[2])
-        bottom_right = gmsh.model.occ.addPoint(r, -2 * r - gap, 0.0)
-        bottom_left = gmsh.model.occ.addPoint(-r, -2 * r - gap, 0.0)
-        top2 = gmsh.model.occ.addPoint(0, -r - gap, 0)
-        right2 = gmsh.model.occ.addPoint(r * np.sin(angle), r * np.cos(angle) - 2 * r - gap, 0)
-        left2 = gmsh.model.occ.addPoint(-r * np.sin(angle), r * np.cos(angle) - 2 * r - gap, 0)
+        arcs1.append(add_arc(top_left, c, left1))
+        arcs1.append(add_arc(left1, c, bottom1))
+        arcs1.append(add_arc(bottom1, c, right1))
+        arcs1.append(add_arc(right1, c, top_right))
+        line1 = add_line(top_right, c)
+        line2 = add_line(c, bottom1)
+        line3 = add_line(top_left, c)
+        curve = add_curve_loop([arcs1[2], arcs1[3], line1, line2])
+        curve2 = add_curve_loop([-line2, -line3, arcs1[0], arcs1[1]])
+        surface = add_surface([curve])
+        surface2 = add_surface([curve2])
+
+        # Create second quarter disk. Built point-by-point rather than with
+        # occ.copy + mirror + translate of the first disk: the copy would
+        # renumber the boundary curves, and the hertz_contact demos select
+        # boundaries through hard-coded physical tags that depend on the
+        # creation order below.
+        c2 = add_point(center[0], center[1] - 2 * r - gap, center[2])
+        bottom_right = add_point(r, -2 * r - gap, 0.0)
+        bottom_left = add_point(-r, -2 * r - gap, 0.0)
+        top2 = add_point(0, -r - gap, 0)
+        right2 = add_point(r * sa, r * ca - 2 * r - gap, 0)
+        left2 = add_point(-r * sa, r * ca - 2 * r - gap, 0)
         arcs2 = []
-        arcs2.append(gmsh.model.occ.addCircleArc(bottom_left, c2, left2))
-        arcs2.append(gmsh.model.occ.addCircleArc(left2, c2, top2))
-        arcs2.append(gmsh.model.occ.addCircleArc(top2, c2, right2))
-        arcs2.append(gmsh.model.occ.addCircleArc(right2, c2, bottom_right))
-        line3 = gmsh.model.occ.addLine(top2, c2)
-        line4 = gmsh.model.occ.addLine(c2, bottom_right)
-        line5 = gmsh.model.occ.addLine(bottom_left, c2)
-        curve3 = gmsh.model.occ.addCurveLoop([arcs2[2], arcs2[3], -line4, -line3])
-        curve4 = gmsh.model.occ.addCurveLoop([arcs2[0], arcs2[1], line3, -line5])
-        surface3 = gmsh.model.occ.addPlaneSurface([curve3])
-        surface4 = gmsh.model.occ.addPlaneSurface([curve4])
+        arcs2.append(add_arc(bottom_left, c2, left2))
+        arcs2.append(add_arc(left2, c2, top2))
+        arcs2.append(add_arc(top2, c2, right2))
+        arcs2.append(add_arc(right2, c2, bottom_right))
+        line3 = add_line(top2, c2)
+        line4 = add_line(c2, bottom_right)
+        line5 = add_line(bottom_left, c2)
+        curve3 = add_curve_loop([arcs2[2], arcs2[3], -line4, -line3])
+        curve4 = add_curve_loop([arcs2[0], arcs2[1], line3, -line5])
+        surface3 = add_surface([curve3])
+        surface4 = add_surface([curve4])
 
         # Synchronize and create physical tags
-        gmsh.model.occ.synchronize()
+        occ.synchronize()
         gmsh.model.addPhysicalGroup(2, [surface, surface2], tag=1)
 
         gmsh.model.addPhysicalGroup(2, [surface3, surface4], tag=2)
 
         bndry1 = gmsh.model.getBoundary([(2, surface), (2, surface2)], oriented=False)
-        [gmsh.model.addPhysicalGroup(b[0], [b[1]]) for b in bndry1]
+        _tag_boundary(bndry1)
         bndry2 = gmsh.model.getBoundary([(2, surface3), (2, surface4)], oriented=False)
-        [gmsh.model.addPhysicalGroup(b[0], [b[1]]) for b in bndry2]
+        _tag_boundary(bndry2)
 
         gmsh.model.mesh.field.add("Distance", 1)
         gmsh.model.mesh.field.setNumbers(1, "NodesList", [bottom1])
@@ -217,55 +332,54 @@ def create_quarter_disks_mesh(filename: str, res=0.1, order: int = 1, quads=Fals
         gmsh.model.mesh.field.setNumber(2, "DistMin", r / 2)
         gmsh.model.mesh.field.setNumber(2, "DistMax", r)
         gmsh.model.mesh.field.setAsBackgroundMesh(2)
-        if quads:
-            gmsh.option.setNumber("Mesh.RecombinationAlgorithm", 8)
-            gmsh.option.setNumber("Mesh.RecombineAll", 2)
-            gmsh.option.setNumber("Mesh.SubdivisionAlgorithm", 1)
+        _configure_quads(quads)
 
         gmsh.model.mesh.generate(2)
         gmsh.model.mesh.setOrder(order)
 
         # gmsh.option.setNumber("Mesh.SaveAll", 1)
         gmsh.write(filename)
-    MPI.COMM_WORLD.Barrier()
-    gmsh.finalize()
-
-
-def sliding_wedges(filename: str, quads: bool = False, res: float = 0.1, order: int = 1, angle=np.pi / 12):
-    gmsh.initialize()
-    if MPI.COMM_WORLD.rank == 0:
-        bl = gmsh.model.occ.addPoint(0, 0, 0)
-        br = gmsh.model.occ.addPoint(9, 0, 0)
-        tl = gmsh.model.occ.addPoint(3, 3 + 9 * np.tan(angle), 0)
-        tr = gmsh.model.occ.addPoint(6, 3 + 9 * np.tan(angle), 0)
-        cl = gmsh.model.occ.addPoint(0, 2, 0)
-        cr = gmsh.model.occ.addPoint(9, 2 + 9 * np.tan(angle), 0)
-        ctl = gmsh.model.occ.addPoint(3, 2 + 3 * np.tan(angle), 0)
-        ctr = gmsh.model.occ.addPoint(6, 2 + 6 * np.tan(angle), 0)
-        cbl = gmsh.model.occ.addPoint(3 + 1.0 * res, 2 + (3 + 1.0 * res) * np.tan(angle), 0)
-        cbr = gmsh.model.occ.addPoint(6 + 0.5 * res, 2 + (6 + 0.5 * res) * np.tan(angle), 0)
-
-        lb1 = gmsh.model.occ.addLine(bl, br)
-        lb2 = gmsh.model.occ.addLine(br, cr)
-        lb3 = gmsh.model.occ.addLine(cr, cbr)
-        lb4 = gmsh.model.occ.addLine(cbr, cbl)
-        lb5 = gmsh.model.occ.addLine(cbl, cl)
-        lb6 = gmsh.model.occ.addLine(cl, bl)
-
-        curve1 = gmsh.model.occ.addCurveLoop([lb1, lb2, lb3, lb4, lb5, lb6])
-
-        lt1 = gmsh.model.occ.addLine(ctl, ctr)
-        lt2 = gmsh.model.occ.addLine(ctr, tr)
-        lt3 = gmsh.model.occ.addLine(tr, tl)
-        lt4 = gmsh.model.occ.addLine(tl, ctl)
-
-        curve2 = gmsh.model.occ.addCurveLoop([lt1, lt2, lt3, lt4])
-
-        surface1 = gmsh.model.occ.addPlaneSurface([curve1])
-        gmsh.model.occ.synchronize()
-        surface2 = gmsh.model.occ.addPlaneSurface([curve2])
-
-        gmsh.model.occ.synchronize()
+    comm.Barrier()
+    gmsh.clear()
+
+
+def sliding_wedges(filename: str, quads: bool = False, res: float = 0.1, order: int = 1, angle=np.pi / 12,
+                   comm=MPI.COMM_WORLD, num_threads=None, verbose=False):
+    _initialize_gmsh(num_threads, verbose)
+    if comm.rank == 0:
+        occ = gmsh.model.occ
+        add_point = occ.addPoint
+        add_line = occ.addLine
+        add_curve_loop = occ.addCurveLoop
+        add_surface = occ.addPlaneSurface
+        # Evaluate tan(angle) once instead of per corner point
+        ta = math.tan(angle)
+        pts = [(0, 0), (9, 0), (3, 3 + 9 * ta), (6, 3 + 9 * ta),
+               (0, 2), (9, 2 + 9 * ta), (3, 2 + 3 * ta), (6, 2 + 6 * ta),
+               (3 + 1.0 * res, 2 + (3 + 1.0 * res) * ta),
+               (6 + 0.5 * res, 2 + (6 + 0.5 * res) * ta)]
+        bl, br, tl, tr, cl, cr, ctl, ctr, cbl, cbr = [add_point(x, y, 0) for x, y in pts]
+
+        lb1 = add_line(bl, br)
+        lb2 = add_line(br, cr)
+        lb3 = add_line(cr, cbr)
+        lb4 = add_line(cbr, cbl)
+        lb5 = add_line(cbl, cl)
+        lb6 = add_line(cl, bl)
+
+        curve1 = add_curve_loop([lb1, lb2, lb3, lb4, lb5, lb6])
+
+        lt1 = add_line(ctl, ctr)
+        lt2 = add_line(ctr, tr)
+        lt3 = add_line(tr, tl)
+        lt4 = add_line(tl, ctl)
+
+        curve2 = add_curve_loop([lt1, lt2, lt3, lt4])
+
+        surface1 = add_surface([curve1])
+        surface2 = add_surface([curve2])
+
+        occ.synchronize()
 
         gmsh.model.addPhysicalGroup(2, [surface2], tag=1)
         gmsh.model.addPhysicalGroup(2, [surface1], tag=2)
@@ -276,7 +390,7 @@ def sliding_wedges(filename: str, quads: bool = False, res: float = 0.1, order:
         gmsh.model.addPhysicalGroup(1, [bndry1[2][1], bndry1[3][1], bndry1[4][1]])
         gmsh.model.addPhysicalGroup(1, [bndry1[5][1]])
         bndry2 = gmsh.model.getBoundary([(2, surface2)], oriented=False)
-        [gmsh.model.addPhysicalGroup(b[0], [b[1]]) for b in bndry2]
+        _tag_boundary(bndry2)
 
         gmsh.model.mesh.field.add("Distance", 1)
         gmsh.model.mesh.field.setNumbers(1, "NodesList", [ctl, ctr])
@@ -289,21 +403,19 @@ def sliding_wedges(filename: str, quads: bool = False, res: float = 0.1, order:
         gmsh.model.mesh.field.setNumber(2, "DistMax", 1.0)
         gmsh.model.mesh.field.setAsBackgroundMesh(2)
 
-        if quads:
-            gmsh.option.setNumber("Mesh.RecombinationAlgorithm", 8)
-            gmsh.option.setNumber("Mesh.RecombineAll", 2)
-            gmsh.option.setNumber("Mesh.SubdivisionAlgorithm", 1)
+        _configure_quads(quads)
 
         gmsh.model.mesh.generate(2)
         gmsh.model.mesh.setOrder(order)
 
         # gmsh.option.setNumber("Mesh.SaveAll", 1)
         gmsh.write(filename)
-    MPI.COMM_WORLD.Barrier()
-    gmsh.finalize()
+    comm.Barrier()
+    gmsh.clear()
 
 
-def create_circle_circle_mesh(filename: str, quads: bool = False, res: float = 0.1, order: int = 1):
+def create_circle_circle_mesh(filename: str, quads: bool = False, res: float = 0.1, order: int = 1,
+                              comm=MPI.COMM_WORLD, num_threads=None, verbose=False):
     """
     Create two circular meshes, with radii 0.3 and 0.6 with centers (0.5,0.5) and (0.5, -0.5)
     """
@@ -311,41 +423,49 @@ def create_circle_circle_mesh(filename: str, quads: bool = False, res: float = 0
     r = 0.3
     angle = np.pi / 4
 
-    gmsh.initialize()
-    if MPI.COMM_WORLD.rank == 0:
+    _initialize_gmsh(num_threads, verbose)
+    if comm.rank == 0:
+        occ = gmsh.model.occ
+        add_point = occ.addPoint
+        add_arc = occ.addCircleArc
+        add_curve_loop = occ.addCurveLoop
+        add_surface = occ.addPlaneSurface
         # Create circular mesh (divided into 4 segments)
-        c = gmsh.model.occ.addPoint(center[0], center[1], center[2])
+        c = add_point(center[0], center[1], center[2])
+        # Both circles share the same four angles; evaluate the trig for the
+        # two radii in a single vectorized call
+        angles = np.array([angle, -angle, np.pi + angle, np.pi - angle])
+        radii = np.repeat([r, 2 * r], len(angles))
+        xs = radii * np.cos(np.tile(angles, 2))
+        ys = radii * np.sin(np.tile(angles, 2))
         # Add 4 points on circle (clockwise, starting in top left)
-        angles = [angle, -angle, np.pi + angle, np.pi - angle]
-        c_points = [gmsh.model.occ.addPoint(center[0] + r * np.cos(angle), center[1]
-                                            + r * np.sin(angle), center[2]) for angle in angles]
-        arcs = [gmsh.model.occ.addCircleArc(
+        c_points = [add_point(center[0] + x, center[1] + y, center[2])
+                    for x, y in zip(xs[:4], ys[:4])]
+        arcs = [add_arc(
             c_points[i - 1], c, c_points[i]) for i in range(len(c_points))]
-        curve = gmsh.model.occ.addCurveLoop(arcs)
-        gmsh.model.occ.synchronize()
-        surface = gmsh.model.occ.addPlaneSurface([curve])
+        curve = add_curve_loop(arcs)
+        surface = add_surface([curve])
         # Create 2nd circular mesh (divided into 4 segments)
         center2 = [0.5, -0.5, 0]
-        c2 = gmsh.model.occ.addPoint(center2[0], center2[1], center2[2])
+        c2 = add_point(center2[0], center2[1], center2[2])
         # Add 4 points on circle (clockwise, starting in top left)
-        c_points2 = [gmsh.model.occ.addPoint(center2[0] + 2 * r * np.cos(angle), center2[1]
-                                             + 2 * r * np.sin(angle), center2[2]) for angle in angles]
-        arcs2 = [gmsh.model.occ.addCircleArc(
+        c_points2 = [add_point(center2[0] + x, center2[1] + y, center2[2])
+                     for x, y in zip(xs[4:], ys[4:])]
+        arcs2 = [add_arc(
             c_points2[i - 1], c2, c_points2[i]) for i in range(len(c_points2))]
-        curve2 = gmsh.model.occ.addCurveLoop(arcs2)
-        gmsh.model.occ.synchronize()
-        surface2 = gmsh.model.occ.addPlaneSurface([curve2])
+        curve2 = add_curve_loop(arcs2)
+        surface2 = add_surface([curve2])
 
         # Synchronize and create physical tags
-        gmsh.model.occ.addPoint(0.5, 0.2, 0, tag=17)
-        gmsh.model.occ.synchronize()
+        add_point(0.5, 0.2, 0, tag=17)
+        occ.synchronize()
         gmsh.model.addPhysicalGroup(2, [surface], tag=1)
         bndry = gmsh.model.getBoundary([(2, surface)], oriented=False)
-        [gmsh.model.addPhysicalGroup(b[0], [b[1]]) for b in bndry]
+        _tag_boundary(bndry)
 
         gmsh.model.addPhysicalGroup(2, [surface2], tag=2)
         bndry2 = gmsh.model.getBoundary([(2, surface2)], oriented=False)
-        [gmsh.model.addPhysicalGroup(b[0], [b[1]]) for b in bndry2]
+        _tag_boundary(bndry2)
 
         gmsh.model.mesh.field.add("Distance", 1)
         gmsh.model.mesh.field.setNumbers(1, "NodesList", [17])
@@ -356,21 +476,19 @@ def create_circle_circle_mesh(filename: str, quads: bool = False, res: float = 0
         gmsh.model.mesh.field.setNumber(2, "LcMax", 3 * res)
         gmsh.model.mesh.field.setNumber(2, "DistMin", 0.3)
         gmsh.model.mesh.field.setNumber(2, "DistMax", 0.6)
-        if quads:
-            gmsh.option.setNumber("Mesh.RecombinationAlgorithm", 8)
-            gmsh.option.setNumber("Mesh.RecombineAll", 2)
-            gmsh.option.setNumber("Mesh.SubdivisionAlgorithm", 1)
+        _configure_quads(quads)
         gmsh.model.mesh.field.setAsBackgroundMesh(2)
         gmsh.model.mesh.generate(2)
         gmsh.model.mesh.setOrder(order)
 
         # gmsh.option.setNumber("Mesh.SaveAll", 1)
         gmsh.write(filename)
-    MPI.COMM_WORLD.Barrier()
-    gmsh.finalize()
+    comm.Barrier()
+    gmsh.clear()
 
 
-def create_box_mesh_2D(filename: str, quads: bool = False, res=0.1, order: int = 1):
+def create_box_mesh_2D(filename: str, quads: bool = False, res=0.1, order: int = 1, comm=MPI.COMM_WORLD,
+                       num_threads=None, verbose=False):
     """
     Create two boxes, one slightly skewed
     """
@@ -379,85 +497,79 @@ def create_box_mesh_2D(filename: str, quads: bool = False, res=0.1, order: int =
     disp = -0.6
     delta = 0.1
 
-    gmsh.initialize()
-    if MPI.COMM_WORLD.rank == 0:
+    _initialize_gmsh(num_threads, verbose)
+    if comm.rank == 0:
+        occ = gmsh.model.occ
+        add_point = occ.addPoint
+        add_line = occ.addLine
+        add_curve_loop = occ.addCurveLoop
+        add_surface = occ.addPlaneSurface
         gmsh.option.setNumber("Mesh.CharacteristicLengthFactor", res)
 
         # Create box
-        p0 = gmsh.model.occ.addPoint(-delta, 0, 0)
-        p1 = gmsh.model.occ.addPoint(length - delta, delta, 0)
-        p2 = gmsh.model.occ.addPoint(length - delta, height + delta, 0)
-        p3 = gmsh.model.occ.addPoint(-delta, height, 0)
+        p0 = add_point(-delta, 0, 0)
+        p1 = add_point(length - delta, delta, 0)
+        p2 = add_point(length - delta, height + delta, 0)
+        p3 = add_point(-delta, height, 0)
         ps = [p0, p1, p2, p3]
-        lines = [gmsh.model.occ.addLine(ps[i - 1], ps[i]) for i in range(len(ps))]
-        curve = gmsh.model.occ.addCurveLoop(lines)
-        surface = gmsh.model.occ.addPlaneSurface([curve])
+        lines = [add_line(ps[i - 1], ps[i]) for i in range(len(ps))]
+        curve = add_curve_loop(lines)
+        surface = add_surface([curve])
 
         # Create box
-        p4 = gmsh.model.occ.addPoint(0, 0 + disp, 0)
-        p5 = gmsh.model.occ.addPoint(length, 0 + disp, 0)
-        p6 = gmsh.model.occ.addPoint(length, height + disp, 0)
-        p7 = gmsh.model.occ.addPoint(0, height + disp, 0)
-        ps2 = [p4, p5, p6, p7]
-        lines2 = [gmsh.model.occ.addLine(ps2[i - 1], ps2[i]) for i in range(len(ps2))]
-        curve2 = gmsh.model.occ.addCurveLoop(lines2)
-        surface2 = gmsh.model.occ.addPlaneSurface([curve2])
+        surface2 = _add_rectangle(0, 0 + disp, length, height)
 
-        gmsh.model.occ.synchronize()
+        # Synchronize once; boundary queries and mesh sizes work on the
+        # synchronized model, so no second entity-map rebuild is needed
+        occ.synchronize()
         res = 0.1
         # Set mesh sizes on the points from the surface we are extruding
         top_nodes = gmsh.model.getBoundary([(2, surface)], recursive=True, oriented=False)
-        gmsh.model.occ.mesh.setSize(top_nodes, res)
+        gmsh.model.mesh.setSize(top_nodes, res)
         bottom_nodes = gmsh.model.getBoundary([(2, surface2)], recursive=True, oriented=False)
-        gmsh.model.occ.mesh.setSize(bottom_nodes, 2 * res)
+        gmsh.model.mesh.setSize(bottom_nodes, 2 * res)
 
-        # Synchronize and create physical tags
-        gmsh.model.occ.synchronize()
+        # Create physical tags
         gmsh.model.addPhysicalGroup(2, [surface], tag=1)
         bndry = gmsh.model.getBoundary([(2, surface)], oriented=False)
-        [gmsh.model.addPhysicalGroup(b[0], [b[1]]) for b in bndry]
+        _tag_boundary(bndry)
 
         gmsh.model.addPhysicalGroup(2, [surface2], tag=2)
         bndry2 = gmsh.model.getBoundary([(2, surface2)], oriented=False)
-        [gmsh.model.addPhysicalGroup(b[0], [b[1]]) for b in bndry2]
+        _tag_boundary(bndry2)
 
-        if quads:
-            gmsh.option.setNumber("Mesh.RecombinationAlgorithm", 8)
-            gmsh.option.setNumber("Mesh.RecombineAll", 2)
-            gmsh.option.setNumber("Mesh.SubdivisionAlgorithm", 1)
+        _configure_quads(quads)
         gmsh.model.mesh.generate(2)
         gmsh.model.mesh.setOrder(order)
 
         # gmsh.option.setNumber("Mesh.SaveAll", 1)
         gmsh.write(filename)
-    MPI.COMM_WORLD.Barrier()
+    comm.Barrier()
 
-    gmsh.finalize()
+    gmsh.clear()
 
 
 def create_box_mesh_3D(filename: str, simplex: bool = True, order: int = 1,
-                       res: float = 0.1, gap: float = 0.1, width: float = 0.5, offset: float = 0.2):
+                       res: float = 0.1, gap: float = 0.1, width: float = 0.5, offset: float = 0.2,
+                       comm=MPI.COMM_WORLD, num_threads=None, verbose=False):
     """
     Create two boxes lying directly over eachother with a gap in between"""
     length = 0.5
     height = 0.5
 
     disp = -width - gap
-    gmsh.initialize()
+    _initialize_gmsh(num_threads, verbose)
     model = gmsh.model
-    if MPI.COMM_WORLD.rank == 0:
+    if comm.rank == 0:
         # Create box
         if simplex:
             model.occ.add_box(0, 0 + offset, 0, length, height, width)
             model.occ.add_box(0, 0, disp, length, height, width)
-            model.occ.synchronize()
         else:
             square1 = model.occ.add_rectangle(0, 0 + offset, 0, length, height)
             square2 = model.occ.add_rectangle(0, 0, disp, length, height)
             model.occ.extrude([(2, square1)], 0, 0, width, numElements=[20], recombine=True)
             model.occ.extrude([(2, square2)], 0, 0, width, numElements=[15], recombine=True)
-            model.occ.synchronize()
-        volumes = model.getEntities(3)
 
         model.mesh.field.add("Box", 1)
         model.mesh.field.setNumber(1, "VIn", res / 5.)
@@ -473,27 +585,44 @@ def create_box_mesh_3D(filename: str, simplex: bool = True, order: int = 1,
 
         # Synchronize and create physical tags
         model.occ.synchronize()
+        if not simplex:
+            # Mesh the swept base squares as transfinite tensor grids, so the
+            # hex mesh is a direct tensor product with no Delaunay/recombine
+            # pass. The extrude construction itself is kept because replacing
+            # it with addBox reorders the boundary entities and would retag
+            # the facets the demos hard-code. The transfinite surfaces ignore
+            # the background field, so the curve counts are sized from the
+            # field values: the contact-side square lies in the refined box
+            # (res / 5), the other square in the coarse region (res).
+            for surf, lc in ((square1, res / 5.), (square2, res)):
+                for _, curve in model.getBoundary([(2, surf)], oriented=False):
+                    xmin, ymin, _, xmax, ymax, _ = model.getBoundingBox(1, curve)
+                    num_nodes = int(np.ceil(max(xmax - xmin, ymax - ymin) / lc)) + 1
+                    model.mesh.setTransfiniteCurve(curve, num_nodes)
+                model.mesh.setTransfiniteSurface(surf)
+                model.mesh.setRecombine(2, surf)
+        volumes = model.getEntities(3)
         model.addPhysicalGroup(volumes[0][0], [volumes[0][1]], tag=1)
         bndry = model.getBoundary([(3, volumes[0][1])], oriented=False)
-        [model.addPhysicalGroup(b[0], [b[1]]) for b in bndry]
+        _tag_boundary(bndry)
 
         model.addPhysicalGroup(3, [volumes[1][1]], tag=2)
         bndry2 = model.getBoundary([(3, volumes[1][1])], oriented=False)
-        [model.addPhysicalGroup(b[0], [b[1]]) for b in bndry2]
-        if not simplex:
-            gmsh.option.setNumber("Mesh.RecombinationAlgorithm", 2)
-            gmsh.option.setNumber("Mesh.RecombineAll", 2)
-            gmsh.option.setNumber("Mesh.SubdivisionAlgorithm", 1)
+        _tag_boundary(bndry2)
+        _configure_quads(not simplex, algorithm=2)
+        if simplex:
+            # HXT: multithreaded Delaunay tetrahedralization
+            gmsh.option.setNumber("Mesh.Algorithm3D", 10)
         model.mesh.generate(3)
         model.mesh.setOrder(order)
         # gmsh.option.setNumber("Mesh.SaveAll", 1)
         gmsh.write(filename)
-    MPI.COMM_WORLD.Barrier()
-    gmsh.finalize()
+    comm.Barrier()
+    gmsh.clear()
 
 
 def create_sphere_plane_mesh(filename: str, order: int = 1, res=0.05, r=0.25, height=0.25,
-                             length=1.0, width=1.0, gap=0.0):
+                             length=1.0, width=1.0, gap=0.0, comm=MPI.COMM_WORLD, num_threads=None, verbose=False):
     """
     Create a 3D sphere with center (0,0,0) an radius r
     with a box at [-length/2, length/2] x [ -width/2, width/2] x [-gap-height-r, -gap-r]
@@ -502,32 +631,37 @@ def create_sphere_plane_mesh(filename: str, order: int = 1, res=0.05, r=0.25, he
     angle = 0
     lc_min = res
     lc_max = 2 * res
-    gmsh.initialize()
-    if MPI.COMM_WORLD.rank == 0:
-        # Create sphere composed of of two volumes
-        sphere_bottom = gmsh.model.occ.addSphere(center[0], center[1], center[2], r, angle1=-np.pi / 2, angle2=-angle)
-        p0 = gmsh.model.occ.addPoint(center[0], center[1], center[2] - r)
-        sphere_top = gmsh.model.occ.addSphere(center[0], center[1], center[2], r, angle1=-angle, angle2=np.pi / 2)
-        out_vol_tags, _ = gmsh.model.occ.fragment([(3, sphere_bottom)], [(3, sphere_top)])
+    _initialize_gmsh(num_threads, verbose)
+    if comm.rank == 0:
+        # Cut a single sphere by the plane z = center[2] - r*sin(angle):
+        # one sphere primitive and a solid/surface fragment instead of
+        # stitching two partial spheres with a solid/solid Boolean
+        occ = gmsh.model.occ
+        sphere = occ.addSphere(center[0], center[1], center[2], r)
+        p0 = occ.addPoint(center[0], center[1], center[2] - r)
+        cut_r = r * math.cos(angle)
+        disk = occ.addDisk(center[0], center[1], center[2] - r * math.sin(angle), cut_r, cut_r)
+        out_vol_tags, _ = occ.fragment([(3, sphere)], [(2, disk)])
+        out_vol_tags = [(dim, tag) for dim, tag in out_vol_tags if dim == 3]
 
         # Add bottom box
-        box = gmsh.model.occ.add_box(-length / 2, -width / 2, -height - r - gap, length, width, height)
+        box = occ.add_box(-length / 2, -width / 2, -height - r - gap, length, width, height)
 
         # Synchronize and create physical tags
-        gmsh.model.occ.synchronize()
+        occ.synchronize()
 
+        # Sort the caps bottom-first so the boundary groups keep the
+        # numbering of the old two-sphere construction
         sphere_boundary = gmsh.model.getBoundary(out_vol_tags, oriented=False)
-        for boundary_tag in sphere_boundary:
-            gmsh.model.addPhysicalGroup(boundary_tag[0], boundary_tag[1:2])
+        sphere_boundary.sort(key=lambda s: occ.getCenterOfMass(s[0], s[1])[2])
+        _tag_boundary(sphere_boundary)
         box_boundary = gmsh.model.getBoundary([(3, box)], oriented=False)
-        for boundary_tag in box_boundary:
-            gmsh.model.addPhysicalGroup(boundary_tag[0], boundary_tag[1:2])
+        _tag_boundary(box_boundary)
 
         p_v = [v_tag[1] for v_tag in out_vol_tags]
         gmsh.model.addPhysicalGroup(3, p_v, tag=1)
         gmsh.model.addPhysicalGroup(3, [box], tag=2)
 
-        gmsh.model.occ.synchronize()
         gmsh.model.mesh.field.add("Distance", 1)
         gmsh.model.mesh.field.setNumbers(1, "NodesList", [p0])
 
@@ -539,16 +673,18 @@ def create_sphere_plane_mesh(filename: str, order: int = 1, res=0.05, r=0.25, he
         gmsh.model.mesh.field.setNumber(2, "DistMax", r)
         gmsh.model.mesh.field.setAsBackgroundMesh(2)
 
+        # HXT: multithreaded Delaunay tetrahedralization
+        gmsh.option.setNumber("Mesh.Algorithm3D", 10)
         gmsh.model.mesh.generate(3)
         gmsh.model.mesh.setOrder(order)
 
         # gmsh.option.setNumber("Mesh.SaveAll", 1)
         gmsh.write(filename)
-    MPI.COMM_WORLD.Barrier()
-    gmsh.finalize()
+    comm.Barrier()
+    gmsh.clear()
 
 
-def create_sphere_sphere_mesh(filename: str, order: int = 1):
+def create_sphere_sphere_mesh(filename: str, order: int = 1, comm=MPI.COMM_WORLD, num_threads=None, verbose=False):
     """
     Create a 3D mesh consisting of two spheres with radii 0.3 and 0.6 and
     centers (0.5,0.5,0.5) and (0.5,0.5,-0.5)
@@ -558,37 +694,43 @@ def create_sphere_sphere_mesh(filename: str, order: int = 1):
     angle = np.pi / 8
     lc_min = 0.05 * r
     lc_max = 0.2 * r
-    gmsh.initialize()
-    if MPI.COMM_WORLD.rank == 0:
-        # Create sphere 1 composed of of two volumes
-        sphere_bottom = gmsh.model.occ.addSphere(center[0], center[1], center[2], r, angle1=-np.pi / 2, angle2=-angle)
-        p0 = gmsh.model.occ.addPoint(center[0], center[1], center[2] - r)
-        sphere_top = gmsh.model.occ.addSphere(center[0], center[1], center[2], r, angle1=-angle, angle2=np.pi / 2)
-        out_vol_tags, _ = gmsh.model.occ.fragment([(3, sphere_bottom)], [(3, sphere_top)])
-
-        # Create sphere 2 composed of of two volumes
-        sphere_bottom2 = gmsh.model.occ.addSphere(
-            center[0], center[1], -center[2], 2 * r, angle1=-np.pi / 2, angle2=-angle)
-        p1 = gmsh.model.occ.addPoint(center[0], center[1], -center[2] - 2 * r)
-        sphere_top2 = gmsh.model.occ.addSphere(center[0], center[1], -center[2], 2 * r, angle1=-angle, angle2=np.pi / 2)
-        out_vol_tags2, _ = gmsh.model.occ.fragment([(3, sphere_bottom2)], [(3, sphere_top2)])
+    _initialize_gmsh(num_threads, verbose)
+    if comm.rank == 0:
+        # Cut each sphere by the plane through z = cz - r*sin(angle): one
+        # sphere primitive and a solid/surface fragment per sphere instead
+        # of stitching two partial spheres with a solid/solid Boolean
+        occ = gmsh.model.occ
+        sphere = occ.addSphere(center[0], center[1], center[2], r)
+        p0 = occ.addPoint(center[0], center[1], center[2] - r)
+        cut_r = r * math.cos(angle)
+        disk = occ.addDisk(center[0], center[1], center[2] - r * math.sin(angle), cut_r, cut_r)
+        out_vol_tags, _ = occ.fragment([(3, sphere)], [(2, disk)])
+        out_vol_tags = [(dim, tag) for dim, tag in out_vol_tags if dim == 3]
+
+        sphere2 = occ.addSphere(center[0], center[1], -center[2], 2 * r)
+        p1 = occ.addPoint(center[0], center[1], -center[2] - 2 * r)
+        cut_r2 = 2 * r * math.cos(angle)
+        disk2 = occ.addDisk(center[0], center[1], -center[2] - 2 * r * math.sin(angle), cut_r2, cut_r2)
+        out_vol_tags2, _ = occ.fragment([(3, sphere2)], [(2, disk2)])
+        out_vol_tags2 = [(dim, tag) for dim, tag in out_vol_tags2 if dim == 3]
 
         # Synchronize and create physical tags
-        gmsh.model.occ.synchronize()
+        occ.synchronize()
 
+        # Sort the caps bottom-first so the boundary groups keep the
+        # numbering of the old two-sphere construction
         sphere_boundary = gmsh.model.getBoundary(out_vol_tags, oriented=False)
-        for boundary_tag in sphere_boundary:
-            gmsh.model.addPhysicalGroup(boundary_tag[0], boundary_tag[1:2])
+        sphere_boundary.sort(key=lambda s: occ.getCenterOfMass(s[0], s[1])[2])
+        _tag_boundary(sphere_boundary)
         sphere_boundary2 = gmsh.model.getBoundary(out_vol_tags2, oriented=False)
-        for boundary_tag in sphere_boundary2:
-            gmsh.model.addPhysicalGroup(boundary_tag[0], boundary_tag[1:2])
+        sphere_boundary2.sort(key=lambda s: occ.getCenterOfMass(s[0], s[1])[2])
+        _tag_boundary(sphere_boundary2)
 
         p_v = [v_tag[1] for v_tag in out_vol_tags]
         p_v2 = [v_tag[1] for v_tag in out_vol_tags2]
         gmsh.model.addPhysicalGroup(3, p_v)
         gmsh.model.addPhysicalGroup(3, p_v2)
 
-        gmsh.model.occ.synchronize()
         gmsh.model.mesh.field.add("Distance", 1)
         gmsh.model.mesh.field.setNumbers(1, "NodesList", [p0, p1])
 
@@ -600,27 +742,28 @@ def create_sphere_sphere_mesh(filename: str, order: int = 1):
         gmsh.model.mesh.field.setNumber(2, "DistMax", r)
         gmsh.model.mesh.field.setAsBackgroundMesh(2)
 
+        # HXT: multithreaded Delaunay tetrahedralization
+        gmsh.option.setNumber("Mesh.Algorithm3D", 10)
         gmsh.model.mesh.generate(3)
         gmsh.model.mesh.setOrder(order)
 
         # gmsh.option.setNumber("Mesh.SaveAll", 1)
         gmsh.write(filename)
-    MPI.COMM_WORLD.Barrier()
-    gmsh.finalize()
+    comm.Barrier()
+    gmsh.clear()
 
 
-def create_cylinder_cylinder_mesh(filename: str, order: int = 1, res=0.25, simplex: bool = False):
-    gmsh.initialize()
+def create_cylinder_cylinder_mesh(filename: str, order: int = 1, res=0.25, simplex: bool = False,
+                                  comm=MPI.COMM_WORLD, num_threads=None, verbose=False):
+    _initialize_gmsh(num_threads, verbose)
     model = gmsh.model()
-    if MPI.COMM_WORLD.rank == 0:
+    if comm.rank == 0:
         # Generate a mesh with 2nd-order hexahedral cells using gmsh
         model_name = "Cylinder-cylinder mesh"
         model.add(model_name)
         model.setCurrent(model_name)
         # Recombine tetrahedrons to hexahedrons
-        if not simplex:
-            gmsh.option.setNumber("Mesh.RecombinationAlgorithm", 2)
-            gmsh.option.setNumber("Mesh.RecombineAll", 2)
+        _configure_quads(not simplex, algorithm=2, subdivide=False)
         # gmsh.option.setNumber("Mesh.CharacteristicLengthFactor", 0.1)
         center1 = (0, 0, 0.5)
         r1 = 0.8
@@ -659,84 +802,76 @@ def create_cylinder_cylinder_mesh(filename: str, order: int = 1, res=0.25, simpl
 
         model.mesh.generate(3)
         model.mesh.setOrder(order)
-    msh, mt_domain, _ = gmshio.model_to_mesh(model, MPI.COMM_WORLD, 0, 3)
+    # model_to_mesh imports on rank 0 and redistributes with dolfinx's own
+    # partitioner; gmshio offers no per-rank read of a partitioned msh file,
+    # so this stays the root-only import path. Partitioning on the gmsh side
+    # would not change that and reclassifies elements onto partition
+    # entities, which breaks the physical-group extraction in gmshio.
+    msh, mt_domain, _ = gmshio.model_to_mesh(model, comm, 0, 3)
 
     msh.name = "cylinder_cylinder"
     mt_domain.name = "domain_marker"
 
     # Permute also entities which are tagged
-    with XDMFFile(MPI.COMM_WORLD, f"{filename}.xdmf", "w") as file:
+    with XDMFFile(comm, f"{filename}.xdmf", "w") as file:
         file.write_mesh(msh)
         file.write_meshtags(mt_domain, msh.geometry)
-    gmsh.finalize()
+    gmsh.clear()
 
 
-def create_2d_rectangle_split(filename: str, quads: bool = False, res=0.1, order: int = 1, gap=0.2):
+def create_2d_rectangle_split(filename: str, quads: bool = False, res=0.1, order: int = 1, gap=0.2,
+                              comm=MPI.COMM_WORLD, num_threads=None, verbose=False):
     """
     Create rectangle split into two domains
     """
     length = 0.5
     height = 0.5
 
-    gmsh.initialize()
-    if MPI.COMM_WORLD.rank == 0:
+    _initialize_gmsh(num_threads, verbose)
+    if comm.rank == 0:
+        occ = gmsh.model.occ
+        add_point = occ.addPoint
         gmsh.option.setNumber("Mesh.CharacteristicLengthFactor", res)
 
         # Create box
-        p0 = gmsh.model.occ.addPoint(0, 0, 0)
-        p1 = gmsh.model.occ.addPoint(length, 0, 0)
-        p2 = gmsh.model.occ.addPoint(length, height, 0)
-        p3 = gmsh.model.occ.addPoint(0, height, 0)
-        ps = [p0, p1, p2, p3]
-        lines = [gmsh.model.occ.addLine(ps[i - 1], ps[i]) for i in range(len(ps))]
-        curve = gmsh.model.occ.addCurveLoop(lines)
-        surface = gmsh.model.occ.addPlaneSurface([curve])
+        surface = _add_rectangle(0, 0, length, height)
 
         # Create box
-        p4 = gmsh.model.occ.addPoint(length + gap, 0, 0)
-        p5 = gmsh.model.occ.addPoint(2 * length + gap, 0, 0)
-        p6 = gmsh.model.occ.addPoint(2 * length + gap, height, 0)
-        p7 = gmsh.model.occ.addPoint(length + gap, height, 0)
-        ps2 = [p4, p5, p6, p7]
-        lines2 = [gmsh.model.occ.addLine(ps2[i - 1], ps2[i]) for i in range(len(ps2))]
-        curve2 = gmsh.model.occ.addCurveLoop(lines2)
-        surface2 = gmsh.model.occ.addPlaneSurface([curve2])
-
-        p8 = gmsh.model.occ.addPoint(2 * length + gap - res / 10, 0.5 * height, 0)
-        p9 = gmsh.model.occ.addPoint(2 * length + gap - res / 5, 0.5 * height, 0)
+        surface2 = _add_rectangle(length + gap, 0, length, height)
 
-        gmsh.model.occ.synchronize()
+        p8 = add_point(2 * length + gap - res / 10, 0.5 * height, 0)
+        p9 = add_point(2 * length + gap - res / 5, 0.5 * height, 0)
+
+        occ.synchronize()
         # Set mesh sizes on the points from the surface we are extruding
         top_nodes = gmsh.model.getBoundary([(2, surface)], recursive=True, oriented=False)
-        gmsh.model.occ.mesh.setSize(top_nodes, 1.2 * res)
+        occ.mesh.setSize(top_nodes, 1.2 * res)
         bottom_nodes = gmsh.model.getBoundary([(2, surface2)], recursive=True, oriented=False)
-        gmsh.model.occ.mesh.setSize(bottom_nodes, res)
+        occ.mesh.setSize(bottom_nodes, res)
         # Synchronize and create physical tags
-        gmsh.model.occ.synchronize()
+        occ.synchronize()
         gmsh.model.addPhysicalGroup(2, [surface], tag=1)
         bndry = gmsh.model.getBoundary([(2, surface)], oriented=False)
-        [gmsh.model.addPhysicalGroup(b[0], [b[1]]) for b in bndry]
+        _tag_boundary(bndry)
 
         gmsh.model.addPhysicalGroup(2, [surface2], tag=2)
         bndry2 = gmsh.model.getBoundary([(2, surface2)], oriented=False)
-        [gmsh.model.addPhysicalGroup(b[0], [b[1]]) for b in bndry2]
+        _tag_boundary(bndry2)
         gmsh.model.mesh.embed(0, [p8, p9], 2, 2)
-        if quads:
-            gmsh.option.setNumber("Mesh.RecombinationAlgorithm", 8)
-            gmsh.option.setNumber("Mesh.RecombineAll", 2)
-            gmsh.option.setNumber("Mesh.SubdivisionAlgorithm", 1)
+        _configure_quads(quads)
         gmsh.model.mesh.generate(2)
         gmsh.model.mesh.setOrder(order)
 
         # gmsh.option.setNumber("Mesh.SaveAll", 1)
         gmsh.write(filename)
-    MPI.COMM_WORLD.Barrier()
+    comm.Barrier()
 
-    gmsh.finalize()
+    gmsh.clear()
 
 
 def create_halfsphere_box_mesh(filename: str, order: int = 1, res=0.05, r=0.25,
-                               height=0.25, length=1.0, width=1.0, gap=0.0):
+                               height=0.25, length=1.0, width=1.0, gap=0.0, comm=MPI.COMM_WORLD,
+                               num_threads=None, verbose=False):
     """
     Create a 3D half-sphere with center (0,0,0), radius r and z<=0.0
     with a box at [-length/2, length/2] x [ -width/2, width/2] x [-gap-height-r, -gap-r]
@@ -745,8 +880,8 @@ def create_halfsphere_box_mesh(filename: str, order: int = 1, res=0.05, r=0.25,
     angle = 0
     lc_min = res
     lc_max = 2 * res
-    gmsh.initialize()
-    if MPI.COMM_WORLD.rank == 0:
+    _initialize_gmsh(num_threads, verbose)
+    if comm.rank == 0:
         # Create sphere composed of of two volumes
         sphere_bottom = gmsh.model.occ.addSphere(center[0], center[1], center[2], r, angle1=-np.pi / 2, angle2=-angle)
         p0 = gmsh.model.occ.addPoint(center[0], center[1], center[2] - r)
@@ -758,16 +893,13 @@ def create_halfsphere_box_mesh(filename: str, order: int = 1, res=0.05, r=0.25,
         gmsh.model.occ.synchronize()
 
         sphere_boundary = gmsh.model.getBoundary([(3, sphere_bottom)], oriented=False)
-        for boundary_tag in sphere_boundary:
-            gmsh.model.addPhysicalGroup(boundary_tag[0], boundary_tag[1:2])
+        _tag_boundary(sphere_boundary)
         box_boundary = gmsh.model.getBoundary([(3, box)], oriented=False)
-        for boundary_tag in box_boundary:
-            gmsh.model.addPhysicalGroup(boundary_tag[0], boundary_tag[1:2])
+        _tag_boundary(box_boundary)
 
         gmsh.model.addPhysicalGroup(3, [sphere_bottom], tag=1)
         gmsh.model.addPhysicalGroup(3, [box], tag=2)
 
-        gmsh.model.occ.synchronize()
         gmsh.model.mesh.field.add("Distance", 1)
         gmsh.model.mesh.field.setNumbers(1, "NodesList", [p0])
 
@@ -779,10 +911,12 @@ def create_halfsphere_box_mesh(filename: str, order: int = 1, res=0.05, r=0.25,
         gmsh.model.mesh.field.setNumber(2, "DistMax", r)
         gmsh.model.mesh.field.setAsBackgroundMesh(2)
 
+        # HXT: multithreaded Delaunay tetrahedralization
+        gmsh.option.setNumber("Mesh.Algorithm3D", 10)
         gmsh.model.mesh.generate(3)
         gmsh.model.mesh.setOrder(order)
 
         # gmsh.option.setNumber("Mesh.SaveAll", 1)
         gmsh.write(filename)
-    MPI.COMM_WORLD.Barrier()
-    gmsh.finalize()
+    comm.Barrier()
+    gmsh.clear()
@@ -70,15 +70,21 @@ class NewtonSolver():
         pc_keys = ["pc_mg_levels", "pc_mg_cycles"]
         pc_opts = {}
         opts = PETSc.Options()  # type: ignore
-        opts.prefixPush(self.krylov_solver.getOptionsPrefix())
+        prefix = self.krylov_solver.getOptionsPrefix()
+        prefixed_opts = []
         for k, v in options.items():
             if k in keys:
                 g_opts[k] = v
             elif k in pc_keys:
                 pc_opts[k] = v
+            elif v is None or v == "":
+                prefixed_opts.append(f"-{prefix}{k}")
             else:
-                opts[k] = v
-        opts.prefixPop()
+                prefixed_opts.append(f"-{prefix}{k} {v}")
+        # Insert all prefixed options in one call instead of one
+        # option-database update per key
+        if prefixed_opts:
+            opts.insertString(" ".join(prefixed_opts))
         for k, v in g_opts.items():
             opts[k] = v
         self.krylov_solver.setFromOptions()
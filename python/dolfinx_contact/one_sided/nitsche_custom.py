@@ -10,12 +10,11 @@ import ufl
 from dolfinx import common as _common
 from dolfinx import fem as _fem
 from dolfinx.fem.petsc import create_matrix, create_vector
-from dolfinx import log as _log
 from dolfinx import mesh as dmesh
 from dolfinx.graph import adjacencylist
 import dolfinx_contact
-from dolfinx_contact.cpp import (Contact, ContactMode, generate_rigid_surface_kernel, pack_coefficient_quadrature,
-                                 pack_gradient_quadrature)
+from dolfinx_contact.cpp import (Contact, ContactMode, generate_rigid_surface_kernel,
+                                 pack_coefficient_and_gradient_quadrature)
 from dolfinx_contact.helpers import (epsilon, lame_parameters,
                                      rigid_motions_nullspace, sigma_func)
 
@@ -104,8 +103,9 @@ def nitsche_custom(mesh: dmesh.Mesh, mesh_data: Tuple[dmesh.MeshTags, int, int],
 
     # Compute classical (volume) contributions of the equations of linear elasticity
     dx = ufl.Measure("dx", domain=mesh)
-    J = ufl.inner(sigma(du), epsilon(v)) * dx
-    F = ufl.inner(sigma(u), epsilon(v)) * dx
+    eps_v = epsilon(v)
+    J = ufl.inner(sigma(du), eps_v) * dx
+    F = ufl.inner(sigma(u), eps_v) * dx
 
     # Nitsche for Dirichlet
     # https://doi.org/10.1016/j.cma.2018.05.024
@@ -116,36 +116,38 @@ def nitsche_custom(mesh: dmesh.Mesh, mesh_data: Tuple[dmesh.MeshTags, int, int],
         disp_vec = np.zeros(mesh.geometry.dim)
         disp_vec[mesh.geometry.dim - 1] = vertical_displacement
         u_D = ufl.as_vector(disp_vec)
-        F += - ufl.inner(sigma(u) * n, v) * ds(dirichlet_value)\
-             - theta * ufl.inner(sigma(v) * n, u - u_D) * \
-            ds(dirichlet_value) + E * gamma / h * ufl.inner(u - u_D, v) * ds(dirichlet_value)
-        J += - ufl.inner(sigma(du) * n, v) * ds(dirichlet_value)\
-            - theta * ufl.inner(sigma(v) * n, du) * \
-            ds(dirichlet_value) + E * gamma / h * ufl.inner(du, v) * ds(dirichlet_value)
+        # Bind the repeated tractions and the penalty factor once so the
+        # form compiler sees a single occurrence of each sub-expression
+        sig_u_n = sigma(u) * n
+        sig_du_n = sigma(du) * n
+        sig_v_n = sigma(v) * n
+        gamma_h = E * gamma / h
+        F += - ufl.inner(sig_u_n, v) * ds(dirichlet_value)\
+            + gamma_h * ufl.inner(u - u_D, v) * ds(dirichlet_value)
+        J += - ufl.inner(sig_du_n, v) * ds(dirichlet_value)\
+            + gamma_h * ufl.inner(du, v) * ds(dirichlet_value)
+        # theta is a plain Python scalar restricted to {-1, 0, 1}; for the
+        # non-symmetric variant (theta=0) the symmetry term is omitted at
+        # form-construction time so FFCx never generates code for it
+        if theta != 0:
+            F += - theta * ufl.inner(sig_v_n, u - u_D) * ds(dirichlet_value)
+            J += - theta * ufl.inner(sig_v_n, du) * ds(dirichlet_value)
     else:
         raise RuntimeError("Dirichlet bc not implemented in custom assemblers yet.")
 
     # Custom assembly of contact boundary condition
     q_rule = dolfinx_contact.QuadratureRule(mesh.topology.cell_types[0], quadrature_degree,
                                             mesh.topology.dim - 1, basix.QuadratureType.Default)
-    consts = np.array([E * gamma, theta])
-    consts = np.hstack((consts, n_vec))
-
-    # Compute coefficients for mu and lambda as DG-0 functions
-    V2 = _fem.FunctionSpace(mesh, ("DG", 0))
-    lmbda2 = _fem.Function(V2)
-    lmbda2.interpolate(lambda x: np.full((1, x.shape[1]), lmbda))
-    mu2 = _fem.Function(V2)
-    mu2.interpolate(lambda x: np.full((1, x.shape[1]), mu))
+    consts = np.empty(2 + mesh.geometry.dim, dtype=np.float64)
+    consts[0] = E * gamma
+    consts[1] = theta
+    consts[2:] = n_vec
 
     # Compute integral entities on exterior facets (cell_index, local_index)
     bottom_facets = facet_marker.find(contact_value)
     integral = _fem.IntegralType.exterior_facet
     integral_entities, num_local = dolfinx_contact.compute_active_entities(mesh._cpp_object, bottom_facets, integral)
     integral_entities = integral_entities[:num_local, :]
-    # Pack mu and lambda on facets
-    coeffs = np.hstack([pack_coefficient_quadrature(mu2._cpp_object, 0, integral_entities),
-                        pack_coefficient_quadrature(lmbda2._cpp_object, 0, integral_entities)])
     # Pack circumradius of facets
     h_facets = dolfinx_contact.pack_circumradius(mesh._cpp_object, integral_entities)
 
@@ -161,55 +163,70 @@ def nitsche_custom(mesh: dmesh.Mesh, mesh_data: Tuple[dmesh.MeshTags, int, int],
     # Compute gap from contact boundary
     g_vec = contact.pack_gap_plane(0, -plane_loc)
 
-    # Concatenate coefficients
-    coeffs = np.hstack([coeffs, h_facets, g_vec])
-
     # Create RHS kernels
     L_custom = _fem.form(F, jit_options=jit_options, form_compiler_options=form_compiler_options)
     kernel_rhs = generate_rigid_surface_kernel(V._cpp_object, dolfinx_contact.Kernel.Rhs, q_rule)
-    # NOTE: HACK to make "one-sided" contact work with assemble_matrix/assemble_vector
-    search_mode = [ContactMode.ClosestPoint]
+    # NOTE: HACK to make "one-sided" contact work with assemble_matrix/assemble_vector.
+    # The separate map-free instance cannot be folded into `contact`: once
+    # create_distance_map has run, assemble_matrix also inserts blocks for
+    # the linked cells on the other surface, which lie outside the sparsity
+    # pattern of the Jacobian form used to create the matrix.
     contact_assembler = Contact([facet_marker._cpp_object], surfaces, [(0, 1)],
                                 mesh._cpp_object, search_mode, quadrature_degree=quadrature_degree)
 
-    def assemble_residual(x, b, cf):
+    # Create Jacobian kernels
+    a_custom = _fem.form(J, jit_options=jit_options, form_compiler_options=form_compiler_options)
+    kernel_j = generate_rigid_surface_kernel(V._cpp_object, dolfinx_contact.Kernel.Jac, q_rule)
+
+    # Preallocate the coefficient buffer once, laid out field-by-field as
+    # (mu | lmbda | h | gap | u | grad(u)) with the column offsets computed
+    # here; each field is written into its own slice, so no temporaries are
+    # concatenated and only the u/grad(u) columns are overwritten inside
+    # the Newton solver. The Lame parameters are spatially constant and
+    # filled directly instead of interpolating DG-0 functions and packing
+    # them at quadrature points.
+    ug_packed = pack_coefficient_and_gradient_quadrature(u._cpp_object, quadrature_degree, integral_entities)
+    h_off = 2
+    g_off = h_off + h_facets.shape[1]
+    u_off = g_off + g_vec.shape[1]
+    coefficients = np.empty((integral_entities.shape[0], u_off + ug_packed.shape[1]))
+    coefficients[:, 0] = mu
+    coefficients[:, 1] = lmbda
+    coefficients[:, h_off:g_off] = h_facets
+    coefficients[:, g_off:u_off] = g_vec
+    coefficients[:, u_off:] = ug_packed
+
+    def pack_coefficients(x, cf):
+        """
+        Function for updating packed coefficients inside the Newton solver.
+        As only u is varying within the Newton solver, we only update it.
+        """
         size_local = V.dofmap.index_map.size_local
         bs = V.dofmap.index_map_bs
         u.x.array[:size_local * bs] = x.array_r[:size_local * bs]
-        u_packed = pack_coefficient_quadrature(u._cpp_object, quadrature_degree, integral_entities)
-        grad_u_packed = pack_gradient_quadrature(
+        u.x.scatter_forward()
+        cf[0][:, u_off:] = pack_coefficient_and_gradient_quadrature(
             u._cpp_object, quadrature_degree, integral_entities)
-        c = np.hstack([coeffs, u_packed, grad_u_packed])
+
+    def assemble_residual(x, b, cf):
         with b.localForm() as b_local:
             b_local.set(0.0)
-        contact_assembler.assemble_vector(b, 0, kernel_rhs, c, consts, V._cpp_object)
+        contact_assembler.assemble_vector(b, 0, kernel_rhs, cf[0], consts, V._cpp_object)
         _fem.petsc.assemble_vector(b, L_custom)
 
-    # Create Jacobian kernels
-    a_custom = _fem.form(J, jit_options=jit_options, form_compiler_options=form_compiler_options)
-    kernel_j = generate_rigid_surface_kernel(V._cpp_object, dolfinx_contact.Kernel.Jac, q_rule)
-
     def assemble_jacobian(x, a_mat, cf):
-        size_local = V.dofmap.index_map.size_local
-        bs = V.dofmap.index_map_bs
-        u.x.array[:size_local * bs] = x.array_r[:size_local * bs]
-        u_packed = pack_coefficient_quadrature(u._cpp_object, quadrature_degree, integral_entities)
-        grad_u_packed = pack_gradient_quadrature(u._cpp_object, quadrature_degree, integral_entities)
-        c = np.hstack([coeffs, u_packed, grad_u_packed])
         a_mat.zeroEntries()
-        contact_assembler.assemble_matrix(a_mat, 0, kernel_j, c, consts, V._cpp_object)
+        contact_assembler.assemble_matrix(a_mat, 0, kernel_j, cf[0], consts, V._cpp_object)
         _fem.petsc.assemble_matrix(a_mat, a_custom)
         a_mat.assemble()
 
     # Setup Newton-solver
-    def update_cf(x, cf):
-        pass
     a_mat = create_matrix(a_custom)
     b = create_vector(L_custom)
-    solver = dolfinx_contact.NewtonSolver(mesh.comm, a_mat, b, [np.empty((0, 0))])
+    solver = dolfinx_contact.NewtonSolver(mesh.comm, a_mat, b, [coefficients])
     solver.set_jacobian(assemble_jacobian)
     solver.set_residual(assemble_residual)
-    solver.set_coefficients(update_cf)
+    solver.set_coefficients(pack_coefficients)
     solver.set_krylov_options(petsc_options)
     solver.set_newton_options(newton_options)
 
@@ -217,18 +234,14 @@ def nitsche_custom(mesh: dmesh.Mesh, mesh_data: Tuple[dmesh.MeshTags, int, int],
     null_space = rigid_motions_nullspace(V)
     solver.A.setNearNullSpace(null_space)
 
-    def _u_initial(x):
-        values = np.zeros((mesh.geometry.dim, x.shape[1]))
-        values[-1] = -0.01 - plane_loc
-        return values
-
-    # Set initial_condition:
-    u.interpolate(_u_initial)
+    # Set initial condition by writing the constant vertical offset directly
+    # into the dof array; this avoids the Python-callback path through the
+    # interpolation machinery for a componentwise-constant field
+    u.x.array.reshape(-1, mesh.geometry.dim)[:, -1] = -0.01 - plane_loc
+    u.x.scatter_forward()
 
     dofs_global = V.dofmap.index_map_bs * V.dofmap.index_map.size_global
 
-    _log.set_log_level(_log.LogLevel.INFO)
-
     # Solve non-linear problem
     with _common.Timer(f"{dofs_global} Solve Nitsche"):
         n, converged = solver.solve(u)
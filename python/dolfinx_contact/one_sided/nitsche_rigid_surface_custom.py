@@ -6,6 +6,7 @@ from typing import Optional, Dict, Tuple
 
 import basix
 import dolfinx.common as _common
+import dolfinx.cpp as _cpp
 import dolfinx.fem as _fem
 from dolfinx.fem.petsc import create_matrix, create_vector
 import dolfinx.log as _log
@@ -16,7 +17,7 @@ from dolfinx.graph import adjacencylist
 
 import dolfinx_contact
 from dolfinx_contact.cpp import (Contact, ContactMode, Kernel, generate_rigid_surface_kernel,
-                                 pack_coefficient_quadrature, pack_gradient_quadrature)
+                                 pack_coefficient_and_gradient_quadrature)
 from dolfinx_contact.helpers import (epsilon, lame_parameters,
                                      rigid_motions_nullspace, sigma_func)
 
@@ -119,36 +120,57 @@ def nitsche_rigid_surface_custom(mesh: _mesh.Mesh, mesh_data: Tuple[_mesh.MeshTa
 
     # Compute classical (volume) contributions of the equations of linear elasticity
     dx = ufl.Measure("dx", domain=mesh)
-    J = ufl.inner(sigma(du), epsilon(v)) * dx
-    F = ufl.inner(sigma(u), epsilon(v)) * dx
+    eps_v = epsilon(v)
+    J = ufl.inner(sigma(du), eps_v) * dx
+    F = ufl.inner(sigma(u), eps_v) * dx
 
     # Nitsche for Dirichlet, another theta-scheme.
     # https://doi.org/10.1016/j.cma.2018.05.024
     if nitsche_bc:
         ds = ufl.Measure("ds", domain=mesh, subdomain_data=facet_marker)
-        h = ufl.CellDiameter(mesh)
+        # Materialise the cell diameter as a DG-0 coefficient so the
+        # generated kernels load one value per cell instead of recomputing
+        # it from the geometry at every quadrature point
+        V2 = _fem.FunctionSpace(mesh, ("DG", 0))
+        h = _fem.Function(V2)
+        ncells = mesh.topology.index_map(mesh.topology.dim).size_local
+        h.x.array[:ncells] = _cpp.mesh.h(mesh._cpp_object, mesh.topology.dim,
+                                         np.arange(0, ncells, dtype=np.int32))
+        h.x.scatter_forward()
         n = ufl.FacetNormal(mesh)
 
         disp_vec = np.zeros(gdim)
         disp_vec[gdim - 1] = vertical_displacement
         u_D = ufl.as_vector(disp_vec)
-        F += - ufl.inner(sigma(u) * n, v) * ds(dirichlet_value_elastic)\
-             - theta * ufl.inner(sigma(v) * n, u - u_D) * \
-            ds(dirichlet_value_elastic) + E * gamma / h * ufl.inner(u - u_D, v) * ds(dirichlet_value_elastic)
-
-        J += - ufl.inner(sigma(du) * n, v) * ds(dirichlet_value_elastic)\
-            - theta * ufl.inner(sigma(v) * n, du) * \
-            ds(dirichlet_value_elastic) + E * gamma / h * ufl.inner(du, v) * ds(dirichlet_value_elastic)
+        # Bind the repeated tractions and the penalty factor once so the
+        # form compiler sees a single occurrence of each sub-expression
+        # across the two Dirichlet surfaces
+        sig_u_n = sigma(u) * n
+        sig_du_n = sigma(du) * n
+        sig_v_n = sigma(v) * n
+        gamma_h = E * gamma / h
+        F += - ufl.inner(sig_u_n, v) * ds(dirichlet_value_elastic)\
+            + gamma_h * ufl.inner(u - u_D, v) * ds(dirichlet_value_elastic)
+
+        J += - ufl.inner(sig_du_n, v) * ds(dirichlet_value_elastic)\
+            + gamma_h * ufl.inner(du, v) * ds(dirichlet_value_elastic)
 
         # Nitsche bc for rigid plane
         disp_plane = np.zeros(gdim)
         u_D_plane = ufl.as_vector(disp_plane)
-        F += - ufl.inner(sigma(u) * n, v) * ds(dirichlet_value_rigid)\
-             - theta * ufl.inner(sigma(v) * n, u - u_D_plane) * \
-            ds(dirichlet_value_rigid) + E * gamma / h * ufl.inner(u - u_D_plane, v) * ds(dirichlet_value_rigid)
-        J += - ufl.inner(sigma(du) * n, v) * ds(dirichlet_value_rigid)\
-            - theta * ufl.inner(sigma(v) * n, du) * \
-            ds(dirichlet_value_rigid) + E * gamma / h * ufl.inner(du, v) * ds(dirichlet_value_rigid)
+        F += - ufl.inner(sig_u_n, v) * ds(dirichlet_value_rigid)\
+            + gamma_h * ufl.inner(u - u_D_plane, v) * ds(dirichlet_value_rigid)
+        J += - ufl.inner(sig_du_n, v) * ds(dirichlet_value_rigid)\
+            + gamma_h * ufl.inner(du, v) * ds(dirichlet_value_rigid)
+
+        # theta is a plain Python scalar restricted to {-1, 0, 1}; for the
+        # non-symmetric variant (theta=0) the symmetry terms are omitted at
+        # form-construction time so FFCx never generates code for them
+        if theta != 0:
+            F += - theta * ufl.inner(sig_v_n, u - u_D) * ds(dirichlet_value_elastic)\
+                - theta * ufl.inner(sig_v_n, u - u_D_plane) * ds(dirichlet_value_rigid)
+            J += - theta * ufl.inner(sig_v_n, du) * ds(dirichlet_value_elastic)\
+                - theta * ufl.inner(sig_v_n, du) * ds(dirichlet_value_rigid)
     else:
         print("Dirichlet bc not implemented in custom assemblers yet.")
 
@@ -158,29 +180,18 @@ def nitsche_rigid_surface_custom(mesh: _mesh.Mesh, mesh_data: Tuple[_mesh.MeshTa
                                             mesh.topology.dim - 1, basix.QuadratureType.Default)
     consts = np.array([gamma * E, theta])
 
-    # Compute coefficients for mu and lambda as DG-0 functions
-    V2 = _fem.FunctionSpace(mesh, ("DG", 0))
-    lmbda2 = _fem.Function(V2)
-    lmbda2.interpolate(lambda x: np.full((1, x.shape[1]), lmbda))
-    mu2 = _fem.Function(V2)
-    mu2.interpolate(lambda x: np.full((1, x.shape[1]), mu))
-
     # Compute integral entities on exterior facets (cell_index, local_index)
     contact_facets = facet_marker.find(contact_value_elastic)
     integral = _fem.IntegralType.exterior_facet
     integral_entities, num_local = dolfinx_contact.compute_active_entities(mesh._cpp_object, contact_facets, integral)
     integral_entities = integral_entities[:num_local, :]
 
-    # Pack mu and lambda on facets
-    coeffs = np.hstack([pack_coefficient_quadrature(mu2._cpp_object, 0, integral_entities),
-                        pack_coefficient_quadrature(lmbda2._cpp_object, 0, integral_entities)])
-    # Pack celldiameter on facets
-    surface_cells = np.unique(integral_entities[:, 0])
-    h_int = _fem.Function(V2)
-    expr = _fem.Expression(h, V2.element.interpolation_points())
-    h_int.interpolate(expr, surface_cells)
-    h_facets = pack_coefficient_quadrature(
-        h_int._cpp_object, 0, integral_entities)
+    # Pack celldiameter on facets. The diameter is computed directly with
+    # the C++ mesh routine on the cells behind the contact facets instead
+    # of compiling and evaluating an Expression for a cell-constant
+    # quantity; one scalar per (cell, local_facet) row
+    h_facets = _cpp.mesh.h(mesh._cpp_object, mesh.topology.dim,
+                           integral_entities[:, 0].copy()).reshape(-1, 1)
 
     # Create contact class
     data = np.array([contact_value_elastic, contact_value_rigid], dtype=np.int32)
@@ -203,15 +214,34 @@ def nitsche_rigid_surface_custom(mesh: _mesh.Mesh, mesh_data: Tuple[_mesh.MeshTa
     J_custom = _fem.form(J, jit_options=jit_options, form_compiler_options=form_compiler_options)
     kernel_J = generate_rigid_surface_kernel(V._cpp_object, kt.Jac, q_rule, False)
 
-    # NOTE: HACK to make "one-sided" contact work with assemble_matrix/assemble_vector
+    # NOTE: HACK to make "one-sided" contact work with assemble_matrix/assemble_vector.
+    # The separate map-free instance cannot be folded into `contact`: once
+    # create_distance_map has run, assemble_matrix also inserts blocks for
+    # the linked cells on the other surface, which lie outside the sparsity
+    # pattern of the Jacobian form used to create the matrix.
     contact_assembler = Contact([facet_marker._cpp_object], surfaces, [(0, 1)], mesh._cpp_object,
                                 search_mode, quadrature_degree=quadrature_degree)
 
-    # Pack coefficients to get numpy array of correct size for Newton solver
-    u_packed = pack_coefficient_quadrature(u._cpp_object, quadrature_degree, integral_entities)
-    grad_u_packed = pack_gradient_quadrature(u._cpp_object, quadrature_degree, integral_entities)
-
-    offset = coeffs.shape[1] + h_facets.shape[1] + g_vec.shape[1]
+    # Preallocate the coefficient buffer once, laid out field-by-field as
+    # (mu | lmbda | h | gap | u | grad(u) | n_surf) with the column offsets
+    # computed here; each field is written into its own slice, so no
+    # temporaries are concatenated and only the u/grad(u) columns are
+    # overwritten inside the Newton solver. The Lame parameters are
+    # spatially constant and filled directly instead of interpolating DG-0
+    # functions and packing them at quadrature points. Values and
+    # gradients of u are packed in one fused traversal.
+    ug_packed = pack_coefficient_and_gradient_quadrature(u._cpp_object, quadrature_degree, integral_entities)
+    h_off = 2
+    g_off = h_off + h_facets.shape[1]
+    u_off = g_off + g_vec.shape[1]
+    ug_end = u_off + ug_packed.shape[1]
+    coefficients = np.empty((integral_entities.shape[0], ug_end + n_surf.shape[1]))
+    coefficients[:, 0] = mu
+    coefficients[:, 1] = lmbda
+    coefficients[:, h_off:g_off] = h_facets
+    coefficients[:, g_off:u_off] = g_vec
+    coefficients[:, u_off:ug_end] = ug_packed
+    coefficients[:, ug_end:] = n_surf
 
     def pack_coefficients(x, solver_coeffs):
         """
@@ -221,12 +251,9 @@ def nitsche_rigid_surface_custom(mesh: _mesh.Mesh, mesh_data: Tuple[_mesh.MeshTa
         size_local = V.dofmap.index_map.size_local
         bs = V.dofmap.index_map_bs
         u.x.array[:size_local * bs] = x.array_r[:size_local * bs]
-        u_packed = pack_coefficient_quadrature(u._cpp_object, quadrature_degree, integral_entities)
-        grad_u_packed = pack_gradient_quadrature(
+        u.x.scatter_forward()
+        solver_coeffs[0][:, u_off:ug_end] = pack_coefficient_and_gradient_quadrature(
             u._cpp_object, quadrature_degree, integral_entities)
-        solver_coeffs[0][:, offset:offset + u_packed.shape[1]] = u_packed
-        end = offset + u_packed.shape[1] + grad_u_packed.shape[1]
-        solver_coeffs[0][:, offset + u_packed.shape[1]:end] = grad_u_packed
 
     def compute_residual(x, b, coeffs):
         """
@@ -250,8 +277,7 @@ def nitsche_rigid_surface_custom(mesh: _mesh.Mesh, mesh_data: Tuple[_mesh.MeshTa
     A = create_matrix(J_custom)
     b = create_vector(F_custom)
 
-    coefficients = [np.hstack([coeffs, h_facets, g_vec, u_packed, grad_u_packed, n_surf])]
-    solver = dolfinx_contact.NewtonSolver(mesh.comm, A, b, coefficients)
+    solver = dolfinx_contact.NewtonSolver(mesh.comm, A, b, [coefficients])
     solver.set_jacobian(compute_jacobian)
     solver.set_residual(compute_residual)
     solver.set_coefficients(pack_coefficients)
@@ -261,24 +287,16 @@ def nitsche_rigid_surface_custom(mesh: _mesh.Mesh, mesh_data: Tuple[_mesh.MeshTa
     null_space = rigid_motions_nullspace(V)
     solver.A.setNearNullSpace(null_space)
 
-    # Set Newton solver options
-
-    # Create rigid motion null - space
-    null_space = rigid_motions_nullspace(V)
-    solver.A.setNearNullSpace(null_space)
-
     # Set Newton solver options
     solver.set_newton_options(newton_options)
 
-    # Set initial condition
-    def _u_initial(x):
-        values = np.zeros((gdim, x.shape[1]))
-        values[-1] = -vertical_displacement
-        return values
-    u.interpolate(_u_initial)
+    # Set initial condition by writing the constant vertical offset directly
+    # into the dof array; this avoids the Python-callback path through the
+    # interpolation machinery for a componentwise-constant field
+    u.x.array.reshape(-1, gdim)[:, -1] = -vertical_displacement
+    u.x.scatter_forward()
 
     dofs_global = V.dofmap.index_map_bs * V.dofmap.index_map.size_global
-    _log.set_log_level(_log.LogLevel.INFO)
 
     # Solve non-linear problem
     with _common.Timer(f"{dofs_global} Solve Nitsche"):
@@ -5,6 +5,7 @@
 from typing import Dict, Tuple
 
 import dolfinx.common as _common
+import dolfinx.cpp as _cpp
 import dolfinx.fem as _fem
 import dolfinx.log as _log
 import dolfinx.mesh as dmesh
@@ -92,8 +93,15 @@ def nitsche_ufl(mesh: dmesh.Mesh, mesh_data: Tuple[dmesh.MeshTags, int, int],
     n_vec[mesh.geometry.dim - 1] = -1
     n_2 = ufl.as_vector(n_vec)  # Normal of plane (projection onto other body)
 
-    # Scaled Nitsche parameter
-    h = ufl.CellDiameter(mesh)
+    # Scaled Nitsche parameter. The cell diameter is materialised as a DG-0
+    # coefficient so the generated kernels load one value per cell instead of
+    # recomputing it from the geometry at every quadrature point
+    V2 = _fem.FunctionSpace(mesh, ("DG", 0))
+    h = _fem.Function(V2)
+    ncells = mesh.topology.index_map(mesh.topology.dim).size_local
+    h.x.array[:ncells] = _cpp.mesh.h(mesh._cpp_object, mesh.topology.dim,
+                                     np.arange(0, ncells, dtype=np.int32))
+    h.x.scatter_forward()
     gamma_scaled = gamma * E / h
 
     # Mimicking the plane y=-plane_loc
@@ -1,6 +1,8 @@
 # Copyright (C) 2023 Sarah Roggendorf
 #
 # SPDX-License-Identifier:    MIT
+from functools import reduce
+
 import dolfinx
 from matplotlib import pyplot as plt
 from dolfinx.io import VTXWriter
@@ -16,8 +18,8 @@ import ufl
 class ContactWriter:
     __slots__ = ["vtx", "contact", "u", "contact_pairs", "material",
                  "projection_coordinates", "mesh", "facet_list", "facet_mesh",
-                 "msh_to_fm", "pn", "pt", "a_form", "L", "L2", "p_f", "pt_f", "p_hertz",
-                 "t_hertz"]
+                 "fm_to_msh", "pn", "pt", "a_form", "L", "L2", "p_f", "pt_f", "p_hertz",
+                 "t_hertz", "A", "ksp"]
 
     def __init__(self, mesh, contact, u, contact_pairs,
                  material, order, simplex,
@@ -31,23 +33,27 @@ class ContactWriter:
 
         tdim = mesh.topology.dim
         c_to_f = mesh.topology.connectivity(tdim, tdim - 1)
+        # Gather the facet indices (c_to_f.links(cell)[local_index]) for all
+        # entities at once from the flat adjacency data instead of one
+        # Python-level links() call per entity
+        conn = c_to_f.array
+        conn_offsets = c_to_f.offsets
         facet_list = []
         for j in range(len(contact_pairs)):
-            facet_list.append(np.zeros(len(contact.entities[j]), dtype=np.int32))
-            for i, e in enumerate(contact.entities[j]):
-                facet = c_to_f.links(e[0])[e[1]]
-                facet_list[j][i] = facet
+            entities = contact.entities[j]
+            facet_list.append(conn[conn_offsets[entities[:, 0]] + entities[:, 1]].astype(np.int32, copy=False))
         self.facet_list = facet_list
-        facets = np.unique(np.sort(np.hstack([facet_list[j] for j in range(len(contact_pairs))])))
+        # Merge the per-pair facet lists into one sorted unique array without
+        # materialising the full concatenation first
+        facets = reduce(np.union1d, facet_list).astype(np.int32)
         facet_mesh, fm_to_msh = create_submesh(mesh, tdim - 1, facets)[:2]
 
         self.facet_mesh = facet_mesh
-        # Create msh to submsh entity map
-        num_facets = mesh.topology.index_map(tdim - 1).size_local + \
-            mesh.topology.index_map(tdim - 1).num_ghosts
-        msh_to_fm = np.full(num_facets, -1)
-        msh_to_fm[fm_to_msh] = np.arange(len(fm_to_msh))
-        self.msh_to_fm = msh_to_fm
+        # The submesh entity map preserves the order of the sorted input
+        # facets, so the submesh index of a mesh facet is its position in
+        # fm_to_msh; look indices up with a binary search instead of
+        # scattering into a dense table over every facet in the mesh
+        self.fm_to_msh = np.asarray(fm_to_msh, dtype=np.int32)
 
         # Use quadrature element
         if tdim == 2:
@@ -89,12 +95,23 @@ class ContactWriter:
         self.vtx = VTXWriter(self.facet_mesh.comm, f"{fname}_surface_forces.bp", [
                              self.p_f, self.pt_f, self.p_hertz, self.t_hertz], "bp4")
 
+        # The projection matrix only depends on the facet mesh, so assemble
+        # it and set up the LU solver once; the factorisation is computed on
+        # the first solve and reused for every subsequent write
+        self.A = assemble_matrix(self.a_form)
+        self.A.assemble()
+        self.ksp = PETSc.KSP().create(self.facet_mesh.comm)
+        self.ksp.setOperators(self.A)
+        self.ksp.setType("preonly")
+        self.ksp.getPC().setType("lu")
+        self.ksp.getPC().setFactorSolverType("mumps")
+
     def project(self):
         tdim = self.mesh.topology.dim
         for i in range(len(self.contact_pairs)):
-            fgeom = dolfinx_contact.cpp.entities_to_geometry_dofs(self.facet_mesh._cpp_object, tdim - 1,
-                                                                  np.array(self.msh_to_fm[self.facet_list[i]],
-                                                                           dtype=np.int32))
+            fgeom = dolfinx_contact.cpp.entities_to_geometry_dofs(
+                self.facet_mesh._cpp_object, tdim - 1,
+                np.searchsorted(self.fm_to_msh, self.facet_list[i]).astype(np.int32))
             fgeom = fgeom.array
             vali = self.projection_coordinates[i][1]
             xi = self.projection_coordinates[i][0]
@@ -104,13 +121,9 @@ class ContactWriter:
         self.facet_mesh.geometry.x[:, :] = geom[:, :]
 
     def write(self, t, pressure_function, tangent_force):
-        normals = []
-        for i in range(len(self.contact_pairs)):
-            if self.contact.search_method[i] == dolfinx_contact.cpp.ContactMode.Raytracing:
-                n_contact = np.array(-self.contact.pack_nx(i))
-            else:
-                n_contact = np.array(self.contact.pack_ny(i))
-            normals.append(n_contact)
+        # Contact normals according to the search method of each pair; packed
+        # before the submesh geometry is reset below
+        normals = [np.array(self.contact.pack_normals(i)) for i in range(len(self.contact_pairs))]
 
         gdim = self.mesh.geometry.dim
         V = self.u.function_space
@@ -125,9 +138,12 @@ class ContactWriter:
                 self.u._cpp_object, self.contact.q_deg, self.contact.entities[i])
             num_facets = self.contact.entities[i].shape[0]
             num_q_points = n_x.shape[1] // gdim
-            # this assumes mu, lmbda are constant for each body
+            # mu, lmbda are packed per facet in the first two columns of the
+            # coefficient array, so spatially varying materials are handled
             sign = np.array(dolfinx_contact.cpp.compute_contact_forces(
-                grad_u, n_x, num_q_points, num_facets, gdim, self.material[i][0, 0], self.material[i][0, 1]))
+                grad_u, n_x, num_q_points, num_facets, gdim,
+                np.ascontiguousarray(self.material[i][:, 0]),
+                np.ascontiguousarray(self.material[i][:, 1])))
             sign = sign.reshape(num_facets, num_q_points, gdim)
             n_contact = n_contact.reshape(num_facets, num_q_points, gdim)
             pn = np.sum(sign * n_contact, axis=2)
@@ -138,33 +154,27 @@ class ContactWriter:
             forces.append([pn, pt])
 
         num_q_points = np.int32(len(forces[0][0]) / len(self.contact.entities[0]))
+        # The quadrature dofs of a facet are the consecutive range starting at
+        # its submesh index times num_q_points; build all ranges with one
+        # broadcast add instead of a Python range object per facet
+        qp_range = np.arange(num_q_points, dtype=np.int32)
         for j in range(len(self.contact_pairs)):
-            dofs = np.array(np.hstack([range(self.msh_to_fm[self.facet_list[j]][i] * num_q_points,
-                            num_q_points * (self.msh_to_fm[self.facet_list[j]][i] + 1))
-                for i in range(len(self.contact.entities[j]))]))
+            base = (np.searchsorted(self.fm_to_msh, self.facet_list[j]) * num_q_points).astype(np.int32)
+            dofs = (base[:, None] + qp_range[None, :]).ravel()
             self.pn.x.array[dofs] = forces[j][0][:]
             self.pt.x.array[dofs] = forces[j][1][:]
 
-        # Assemble matrix and vector
-        A = assemble_matrix(self.a_form)
-        A.assemble()
+        # Assemble projection right-hand sides
         b = assemble_vector(self.L)
         b.ghostUpdate(addv=PETSc.InsertMode.ADD, mode=PETSc.ScatterMode.REVERSE)
         b2 = assemble_vector(self.L2)
         b2.ghostUpdate(addv=PETSc.InsertMode.ADD, mode=PETSc.ScatterMode.REVERSE)
 
-        # Setup solver
-        ksp = PETSc.KSP().create(self.facet_mesh.comm)
-        ksp.setOperators(A)
-        ksp.setType("preonly")
-        ksp.getPC().setType("lu")
-        ksp.getPC().setFactorSolverType("mumps")
-
-        # Compute projection
-        ksp.solve(b, self.p_f.vector)
+        # Compute projection with the solver set up at construction
+        self.ksp.solve(b, self.p_f.vector)
         self.p_f.x.scatter_forward()
 
-        ksp.solve(b2, self.pt_f.vector)
+        self.ksp.solve(b2, self.pt_f.vector)
         self.pt_f.x.scatter_forward()
 
         # interpolate exact pressure
@@ -189,26 +199,26 @@ def plot_gap(mesh, contact, gaps, entities, num_pairs):
         facet_map = contact.facet_map(i)
         c_to_f = mesh.topology.connectivity(tdim, tdim - 1)
         num_facets = entities[i].shape[0]
-        facet_origin = np.zeros(num_facets, dtype=np.int32)
-        for j in range(num_facets):
-            cell = entities[i][j, 0]
-            f_index = entities[i][j, 1]
-            facet_origin[j] = c_to_f.links(cell)[f_index]
+        # Gather all facet indices in one go from the flat adjacency data
+        facet_origin = c_to_f.array[c_to_f.offsets[entities[i][:, 0]]
+                                    + entities[i][:, 1]].astype(np.int32, copy=False)
         facets_opp = facet_map.array
         facets_opp = facets_opp[facets_opp >= 0]
 
+        # Fetch the geometry nodes of all facets on both surfaces with a
+        # single call instead of one crossing into C++ per facet
+        all_facets = np.concatenate([facets_opp, facet_origin]).astype(np.int32)
+        facet_geometry = dolfinx.cpp.mesh.entities_to_geometry(mesh._cpp_object, fdim, all_facets, False)
+        coords_all = mesh_geometry[facet_geometry]
+
         # Draw facets on opposite surface
         plt.figure(dpi=600)
-        for facet in facets_opp:
-            facet_geometry = dolfinx.cpp.mesh.entities_to_geometry(mesh._cpp_object, fdim, [facet], False)
-            coords = mesh_geometry[facet_geometry][0]
-            plt.plot(coords[:, 0], coords[:, 1], color="black")
+        for k in range(len(facets_opp)):
+            plt.plot(coords_all[k, :, 0], coords_all[k, :, 1], color="black")
         min_x = 1
         max_x = 0
         for j in range(num_facets):
-            facet = facet_origin[j]
-            facet_geometry = dolfinx.cpp.mesh.entities_to_geometry(mesh._cpp_object, fdim, [facet], False)
-            coords = mesh_geometry[facet_geometry][0]
+            coords = coords_all[len(facets_opp) + j]
             plt.plot(coords[:, 0], coords[:, 1], color="black")
             qp = contact.qp_phys(i, j)
             num_qp = qp.shape[0]
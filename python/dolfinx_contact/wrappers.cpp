@@ -469,6 +469,39 @@ PYBIND11_MODULE(cpp, m)
           }
         });
 
+  m.def(
+      "pack_coefficient_and_gradient_quadrature",
+      [](std::shared_ptr<const dolfinx::fem::Function<PetscScalar>> coeff,
+         int q, const py::array_t<std::int32_t, py::array::c_style>& entities)
+      {
+        auto e_span
+            = std::span<const std::int32_t>(entities.data(), entities.size());
+        if (entities.ndim() == 1)
+        {
+
+          auto [coeffs, cstride]
+              = dolfinx_contact::pack_coefficient_and_gradient_quadrature(
+                  coeff, q, e_span, dolfinx::fem::IntegralType::cell);
+          int shape0 = cstride == 0 ? 0 : coeffs.size() / cstride;
+          return dolfinx_wrappers::as_pyarray(std::move(coeffs),
+                                              std::array{shape0, cstride});
+        }
+        else if (entities.ndim() == 2)
+        {
+
+          auto [coeffs, cstride]
+              = dolfinx_contact::pack_coefficient_and_gradient_quadrature(
+                  coeff, q, e_span, dolfinx::fem::IntegralType::exterior_facet);
+          int shape0 = cstride == 0 ? 0 : coeffs.size() / cstride;
+          return dolfinx_wrappers::as_pyarray(std::move(coeffs),
+                                              std::array{shape0, cstride});
+        }
+        else
+        {
+          throw std::invalid_argument("Unsupported entities");
+        }
+      });
+
   m.def(
       "pack_circumradius",
       [](const dolfinx::mesh::Mesh<double>& mesh,
@@ -596,12 +629,16 @@ PYBIND11_MODULE(cpp, m)
   m.def("compute_contact_forces",
         [](const py::array_t<PetscScalar, py::array::c_style>& grad_u,
            const py::array_t<PetscScalar, py::array::c_style>& n_x,
-           int num_q_points, int num_facets, int gdim, double mu, double lmbda)
+           int num_q_points, int num_facets, int gdim,
+           const py::array_t<double, py::array::c_style>& mu,
+           const py::array_t<double, py::array::c_style>& lmbda)
         {
           return dolfinx_contact::compute_contact_forces(
               std::span<const double>(grad_u.data(), grad_u.size()),
               std::span<const double>(n_x.data(), n_x.size()),
-              num_q_points, num_facets, gdim, mu, lmbda);
+              num_q_points, num_facets, gdim,
+              std::span<const double>(mu.data(), mu.size()),
+              std::span<const double>(lmbda.data(), lmbda.size()));
         });
 
   m.def("entities_to_geometry_dofs",
@@ -136,6 +136,51 @@ def test_pack_coeff_on_facet(quadrature_degree, space, degree):
                                    expr_vals[i, gdim * cstride * local_index:gdim * cstride * (local_index + 1)])
 
 
+@pytest.mark.parametrize("ct", [CellType.triangle, CellType.quadrilateral])
+@pytest.mark.parametrize("integral", [IntegralType.cell, IntegralType.exterior_facet])
+@pytest.mark.parametrize("quadrature_degree", range(1, 6))
+@pytest.mark.parametrize("degree", range(1, 6))
+@pytest.mark.parametrize("space", ["Lagrange", "DG"])
+def test_pack_coeff_and_gradient(ct, integral, quadrature_degree, space, degree):
+    N = 15
+    mesh = create_unit_square(MPI.COMM_WORLD, N, N, cell_type=ct)
+    if space == "Lagrange":
+        V = VectorFunctionSpace(mesh, (space, degree))
+    elif space == "DG":
+        V = FunctionSpace(mesh, (space, degree - 1))
+    else:
+        raise RuntimeError("Unsupported space")
+
+    v = Function(V)
+    if space == "DG":
+        v.interpolate(lambda x: x[0] < 0.5 + x[1])
+    else:
+        v.interpolate(lambda x: (x[1], -x[0]))
+
+    # Compute integration entities
+    tdim = mesh.topology.dim
+    if integral == IntegralType.cell:
+        num_cells = mesh.topology.index_map(tdim).size_local
+        entities = np.arange(num_cells, dtype=np.int32)
+    else:
+        entities = locate_entities_boundary(mesh, tdim - 1,
+                                            lambda x: np.logical_or(np.isclose(x[0], 0.0),
+                                                                    np.isclose(x[0], 1.0)))
+    integration_entities, num_local = dolfinx_contact.compute_active_entities(mesh._cpp_object, entities,
+                                                                              integral)
+    integration_entities = integration_entities[:num_local]
+
+    # The fused packer must reproduce the column-wise concatenation of the
+    # separate value and gradient packers
+    values = dolfinx_contact.cpp.pack_coefficient_quadrature(
+        v._cpp_object, quadrature_degree, integration_entities)
+    gradients = dolfinx_contact.cpp.pack_gradient_quadrature(
+        v._cpp_object, quadrature_degree, integration_entities)
+    fused = dolfinx_contact.cpp.pack_coefficient_and_gradient_quadrature(
+        v._cpp_object, quadrature_degree, integration_entities)
+    assert np.allclose(fused, np.hstack([values, gradients]))
+
+
 @pytest.mark.parametrize("quadrature_degree", range(1, 5))
 @pytest.mark.parametrize("degree", range(1, 5))
 def test_sub_coeff(quadrature_degree, degree):